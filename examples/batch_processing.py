@@ -4,14 +4,37 @@ Batch processing examples for multiple cities
 """
 
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
 from imdfetch import IMDWeatherClient
 from imdfetch.exceptions import IMDWeatherError
 
+# WeatherData parameter name -> result column
+PARAMETER_COLUMNS = {
+    "Maximum Temperature": "max_temp",
+    "Minimum Temperature": "min_temp",
+    "24 Hours Rainfall": "rainfall",
+    "Relative Humidity at 08:30": "humidity_morning",
+    "Relative Humidity at 17:30": "humidity_evening",
+}
+NUMERIC_COLUMNS = list(PARAMETER_COLUMNS.values())
+
+
+def _as_float(value: Optional[str]) -> float:
+    """Parse an IMD reading; missing or non-numeric values become NaN."""
+    return float(pd.to_numeric(value, errors="coerce"))
+
+
+def _typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Store readings as float32 and status as a two-value categorical."""
+    for col in NUMERIC_COLUMNS:
+        if col in df:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+    df["status"] = pd.Categorical(df["status"], categories=["success", "error"])
+    return df
+
 
 def get_weather_for_city(client: IMDWeatherClient, city_name: str) -> Dict[str, Any]:
     """
@@ -26,31 +49,33 @@ def get_weather_for_city(client: IMDWeatherClient, city_name: str) -> Dict[str,
     """
     try:
         weather = client.get_current_weather(city_name)
+        readings = weather.get_parameters(PARAMETER_COLUMNS)
         return {
             "city": weather.city,
             "date": weather.date,
             "status": "success",
-            "max_temp": weather.get_parameter("Maximum Temperature"),
-            "min_temp": weather.get_parameter("Minimum Temperature"),
-            "rainfall": weather.get_parameter("24 Hours Rainfall"),
-            "humidity_morning": weather.get_parameter("Relative Humidity at 08:30"),
-            "humidity_evening": weather.get_parameter("Relative Humidity at 17:30"),
+            **{
+                col: _as_float(readings[name])
+                for name, col in PARAMETER_COLUMNS.items()
+            },
         }
     except IMDWeatherError as e:
         return {"city": city_name, "status": "error", "error": str(e)}
 
 
-def batch_weather_sequential(cities: List[str]) -> pd.DataFrame:
+def batch_weather_sequential(
+    client: IMDWeatherClient, cities: List[str]
+) -> pd.DataFrame:
     """
     Get weather data for multiple cities sequentially
 
     Args:
+        client: IMD Weather client instance
         cities: List of city names
 
     Returns:
         DataFrame with weather data
     """
-    client = IMDWeatherClient()
     results = []
 
     print(f"📊 Processing {len(cities)} cities sequentially...")
@@ -65,51 +90,43 @@ def batch_weather_sequential(cities: List[str]) -> pd.DataFrame:
     end_time = time.time()
     print(f"✅ Sequential processing completed in {end_time - start_time:.2f} seconds")
 
-    return pd.DataFrame(results)
+    return _typed_frame(pd.DataFrame(results))
 
 
-def batch_weather_parallel(cities: List[str], max_workers: int = 3) -> pd.DataFrame:
+def batch_weather_parallel(
+    client: IMDWeatherClient, cities: List[str], max_workers: int = 3
+) -> pd.DataFrame:
     """
     Get weather data for multiple cities in parallel
 
     Args:
+        client: IMD Weather client instance, shared by all workers
         cities: List of city names
         max_workers: Maximum number of parallel workers
 
     Returns:
         DataFrame with weather data
     """
-    results = []
-
     print(
         f"🚀 Processing {len(cities)} cities in parallel (max {max_workers} workers)..."
     )
     start_time = time.time()
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Create a client for each worker
-        future_to_city = {}
-        for city in cities:
-            client = IMDWeatherClient()  # Each thread gets its own client
-            future = executor.submit(get_weather_for_city, client, city)
-            future_to_city[future] = city
-
-        # Collect results as they complete
-        for future in as_completed(future_to_city):
-            city = future_to_city[future]
-            try:
-                result = future.result()
-                results.append(result)
-                status = "✅" if result["status"] == "success" else "❌"
-                print(f"   {status} {city}")
-            except Exception as e:
-                print(f"   ❌ {city}: {str(e)}")
-                results.append({"city": city, "status": "error", "error": str(e)})
+    # One call fans the cities out over a thread pool sharing one connection pool
+    df = client.get_weather_batch(cities, max_concurrency=max_workers)
+    for city, status in zip(df["query"], df["status"]):
+        print(f"   {'✅' if status == 'success' else '❌'} {city}")
 
     end_time = time.time()
     print(f"✅ Parallel processing completed in {end_time - start_time:.2f} seconds")
 
-    return pd.DataFrame(results)
+    # Match the column names produced by get_weather_for_city
+    df["city"] = df["city"].fillna(df["query"])
+    return _typed_frame(
+        df.rename(
+            columns={"rh_0830": "humidity_morning", "rh_1730": "humidity_evening"}
+        )
+    )
 
 
 def analyze_weather_data(df: pd.DataFrame) -> None:
@@ -122,48 +139,36 @@ def analyze_weather_data(df: pd.DataFrame) -> None:
     print("\n📊 Weather Data Analysis")
     print("=" * 40)
 
-    # Success rate
-    successful = df[df["status"] == "success"]
-    success_rate = len(successful) / len(df) * 100
-    print(f"📈 Success Rate: {success_rate:.1f}% ({len(successful)}/{len(df)})")
+    # Success rate: one boolean mask, reused for both the success and error views
+    success = (df["status"] == "success").to_numpy()
+    n_success = int(success.sum())
+    success_rate = n_success / len(df) * 100
+    print(f"📈 Success Rate: {success_rate:.1f}% ({n_success}/{len(df)})")
 
-    if len(successful) > 0:
-        # Temperature analysis
-        successful["max_temp_numeric"] = pd.to_numeric(
-            successful["max_temp"], errors="coerce"
-        )
-        successful["min_temp_numeric"] = pd.to_numeric(
-            successful["min_temp"], errors="coerce"
-        )
+    if n_success > 0:
+        # Columns arrive numeric (see _typed_frame): one aggregation pass
+        stats = df.loc[success, ["max_temp", "rainfall"]].agg(["mean", "max", "min"])
 
-        if not successful["max_temp_numeric"].isna().all():
-            print(
-                f"🌡️  Average Max Temperature: {successful['max_temp_numeric'].mean():.1f}°C"
-            )
-            print(
-                f"🔥 Highest Temperature: {successful['max_temp_numeric'].max():.1f}°C"
-            )
-            print(
-                f"❄️  Lowest Max Temperature: {successful['max_temp_numeric'].min():.1f}°C"
-            )
+        # Temperature analysis
+        max_temp = stats["max_temp"]
+        if not pd.isna(max_temp["mean"]):
+            print(f"🌡️  Average Max Temperature: {max_temp['mean']:.1f}°C")
+            print(f"🔥 Highest Temperature: {max_temp['max']:.1f}°C")
+            print(f"❄️  Lowest Max Temperature: {max_temp['min']:.1f}°C")
 
         # Rainfall analysis
-        successful["rainfall_numeric"] = pd.to_numeric(
-            successful["rainfall"], errors="coerce"
-        )
-        rainy_cities = successful[successful["rainfall_numeric"] > 0]
-        if len(rainy_cities) > 0:
-            print(f"🌧️  Cities with rainfall: {len(rainy_cities)}")
-            print(
-                f"💧 Average rainfall (rainy cities): {rainy_cities['rainfall_numeric'].mean():.1f}mm"
-            )
-
-    # Error analysis
-    errors = df[df["status"] == "error"]
-    if len(errors) > 0:
+        rainfall = df.loc[success, "rainfall"]
+        rainy = rainfall[rainfall > 0]
+        if len(rainy) > 0:
+            print(f"🌧️  Cities with rainfall: {len(rainy)}")
+            print(f"💧 Average rainfall (rainy cities): {rainy.mean():.1f}mm")
+
+    # Error analysis (an all-success frame may have no "error" column)
+    if n_success < len(df):
+        errors = df.loc[~success, ["city", "error"]]
         print(f"\n❌ Failed Cities: {len(errors)}")
-        for _, row in errors.iterrows():
-            print(f"   • {row['city']}: {row['error']}")
+        for city, error in errors.itertuples(index=False):
+            print(f"   • {city}: {error}")
 
 
 def main():
@@ -184,18 +189,25 @@ def main():
         "LUCKNOW-MALIHABAD",
     ]
 
+    # One client for everything: its city list, name lookups and pooled
+    # connections are reused by both runs and by every worker thread.
+    client = IMDWeatherClient()
+    client.get_cities()  # warm the city list before fanning out
+
     # Example 1: Sequential processing
     print("\n1. Sequential Processing")
     print("-" * 25)
-    df_sequential = batch_weather_sequential(cities)  # Process first 5 cities
+    df_sequential = batch_weather_sequential(client, cities)
 
     # Example 2: Parallel processing
     print("\n2. Parallel Processing")
     print("-" * 23)
-    df_parallel = batch_weather_parallel(cities, max_workers=3)
+    df_parallel = batch_weather_parallel(client, cities, max_workers=3)
 
     # Example 3: Data analysis
     analyze_weather_data(df_parallel)
+    memory_kb = df_parallel.memory_usage(deep=True).sum() / 1024
+    print(f"🧮 Result frame memory: {memory_kb:.1f} KB")
 
     # Example 4: Export to CSV
     print("\n📁 Exporting data to CSV...")
@@ -6,7 +6,7 @@ Command-line interface for imdfetch package
 import argparse
 import json
 import sys
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 from . import IMDWeatherClient
 from .exceptions import CityNotFoundError, IMDWeatherError, NetworkError
@@ -168,6 +168,37 @@ def get_forecast(
         sys.exit(1)
 
 
+def batch_weather(
+    client: IMDWeatherClient, lines: Iterable[str], concurrency: int = 8
+) -> None:
+    """Get current weather for many cities at once, printing one JSON per line"""
+    identifiers = []
+    for line in lines:
+        name = line.strip()
+        if name:
+            identifiers.append(int(name) if name.isdigit() else name)
+
+    try:
+        results = client.get_many_current_weather(
+            identifiers, max_workers=concurrency, return_exceptions=True
+        )
+    except Exception as e:
+        print(f"❌ Error getting weather: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    failed = 0
+    for identifier, result in zip(identifiers, results):
+        if isinstance(result, Exception):
+            failed += 1
+            record = {"query": identifier, "error": str(result)}
+        else:
+            record = {"query": identifier, **result.to_dict()}
+        print(json.dumps(record))
+
+    if failed:
+        sys.exit(1)
+
+
 def list_cities(client: IMDWeatherClient, limit: Optional[int] = None) -> None:
     """List all available cities"""
     try:
@@ -205,6 +236,7 @@ Examples:
   imd-weather weather 43057
   imd-weather forecast "Bangalore" --days 5
   imd-weather cities --limit 10
+  imd-weather batch --input cities.txt --concurrency 8
         """,
     )
 
@@ -241,6 +273,22 @@ Examples:
         help="Output format (default: text)",
     )
 
+    batch_parser = subparsers.add_parser(
+        "batch", help="Get current weather for many cities (JSON Lines output)"
+    )
+    batch_parser.add_argument(
+        "--input",
+        type=argparse.FileType("r"),
+        default="-",
+        help="File with one city name or ID per line (default: stdin)",
+    )
+    batch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of concurrent requests (default: 8)",
+    )
+
     cities_parser = subparsers.add_parser("cities", help="List all available cities")
     cities_parser.add_argument(
         "--limit",
@@ -264,6 +312,8 @@ Examples:
             get_weather(client, args.city, args.format)
         elif args.command == "forecast":
             get_forecast(client, args.city, args.days, args.format)
+        elif args.command == "batch":
+            batch_weather(client, args.input, args.concurrency)
         elif args.command == "cities":
             limit = None if args.limit == 0 else args.limit
             list_cities(client, limit)
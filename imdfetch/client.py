@@ -2,12 +2,28 @@
 Main client class for interacting with IMD weather services
 """
 
+import threading
+import time
+from bisect import bisect_right
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from math import asin, cos, radians, sin, sqrt
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-import pandas as pd
+import requests
 
 from .constants import (
     CITY_LIST_URL,
@@ -16,6 +32,8 @@ from .constants import (
     INDIA_BBOX,
     IP_GEOLOCATION_URLS,
     JSON_PARAM_FIELDS,
+    RESPONSE_CACHE_MAXSIZE,
+    RESPONSE_CACHE_TTL,
     WEATHER_PARAM_NAMES,
     WEATHER_TEST_URL_PREFIX,
     WEATHER_URL_PREFIX,
@@ -31,6 +49,11 @@ from .weather import (
     WeatherParameter,
 )
 
+if TYPE_CHECKING:  # pandas is imported lazily: it dominates CLI start-up time
+    import pandas as pd
+
+_T = TypeVar("_T")
+
 
 def _clean(v: Any) -> Optional[str]:
     """Stripped string for a JSON value; None preserved. ``_clean(v) or ""``
@@ -38,23 +61,56 @@ def _clean(v: Any) -> Optional[str]:
     return None if v is None else str(v).strip()
 
 
+class _CityIndex(NamedTuple):
+    """A fetched city list and the lookup structures derived from it.
+
+    Published with one attribute assignment (see IMDWeatherClient._set_cities),
+    so a reader holding one snapshot never mixes indexes from two city lists.
+    """
+
+    cities: Tuple[CityInfo, ...]
+    by_exact: Dict[str, List[CityInfo]]
+    by_id: Dict[int, CityInfo]
+    # Every city's lowered display and clean name, NUL-joined (two entries
+    # per city), with the start offset of each entry; see find_city()
+    blob: str
+    starts: List[int]
+    # identifier -> city_id, filled lazily by _resolve_city_id
+    resolved: Dict[Union[int, str], int]
+
+
 class IMDWeatherClient:
     """
     Main client for fetching weather data from India Meteorological Department
     """
 
-    def __init__(self, use_test_endpoint: bool = True):
+    def __init__(
+        self,
+        use_test_endpoint: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize the IMD Weather Client
 
         Args:
             use_test_endpoint: Whether to use the test endpoint for weather data
+            session: Optional requests.Session to reuse; defaults to the
+                module-wide pooled session shared by all clients. Its adapters'
+                retry policy is used as is (see imdfetch.http.new_session)
         """
+        self.session = session
         self.parser = WeatherDataParser()
         self.weather_url_prefix = (
             WEATHER_TEST_URL_PREFIX  # if use_test_endpoint else WEATHER_URL_PREFIX
         )
-        self._cities_cache = None
+        # Replaced wholesale on every refresh; see _ensure_city_index()
+        self._city_index: Optional[_CityIndex] = None
+        self._cities_lock = threading.Lock()
+        # (city tuple it was built from, frame); see get_cities_dataframe()
+        self._cities_frame: Optional[Tuple[Tuple[CityInfo, ...], "pd.DataFrame"]] = None
+        # (kind, city_id) -> (fetched_at, payload); see _cached()
+        self._response_cache: Dict[Tuple[str, int], Tuple[float, Any]] = {}
+        self._response_cache_lock = threading.Lock()
 
     def get_cities(self, refresh_cache: bool = False) -> List[CityInfo]:
         """
@@ -70,14 +126,56 @@ class IMDWeatherClient:
             NetworkError: If unable to fetch city data
             IMDWeatherError: If parsing fails
         """
-        if self._cities_cache is None or refresh_cache:
-            try:
-                response = safe_get(CITY_LIST_URL)
-                self._cities_cache = self.parser.get_cities_dataframe(response.text)
-            except Exception as e:
-                raise IMDWeatherError(f"Failed to fetch cities: {str(e)}")
+        return list(self._ensure_city_index(refresh_cache).cities)
+
+    def _ensure_city_index(self, refresh_cache: bool = False) -> _CityIndex:
+        """The cached city index, fetching the city list on first use.
+
+        Double-checked locking: readers never take the lock once the index is
+        published, and threads racing on a cold cache fetch the list once.
+        Callers should read everything they need from the one snapshot returned.
+        """
+        index = self._city_index
+        if index is not None and not refresh_cache:
+            return index
+
+        with self._cities_lock:
+            index = self._city_index
+            if index is None or refresh_cache:
+                try:
+                    response = safe_get(CITY_LIST_URL, session=self.session)
+                    parsed = self.parser.get_cities_dataframe(response.text)
+                except Exception as e:
+                    raise IMDWeatherError(f"Failed to fetch cities: {str(e)}")
+                index = self._set_cities(parsed)
+            return index
+
+    def _set_cities(self, cities: Iterable[CityInfo]) -> _CityIndex:
+        """Install a freshly fetched city list and rebuild the name indexes.
+
+        Names are lower-cased once here rather than on every find_city call.
+        Everything is built first, then published as one _CityIndex.
+        """
+        cities = tuple(cities)
+        by_exact: Dict[str, List[CityInfo]] = {}
+        by_id: Dict[int, CityInfo] = {}
+        names: List[str] = []
+        starts: List[int] = []
+        offset = 0
+        for city in cities:
+            by_id.setdefault(city.city_id, city)
+            city_display = city.display_name.lower()
+            city_clean = city.clean_name.lower() if city.clean_name else ""
+            for key in {city_display, city_clean}:
+                by_exact.setdefault(key, []).append(city)
+            for name in (city_display, city_clean):
+                names.append(name)
+                starts.append(offset)
+                offset += len(name) + 1
 
-        return self._cities_cache
+        index = _CityIndex(cities, by_exact, by_id, "\0".join(names), starts, {})
+        self._city_index = index
+        return index
 
     def find_city(self, city_name: str, exact_match: bool = False) -> List[CityInfo]:
         """
@@ -90,27 +188,33 @@ class IMDWeatherClient:
         Returns:
             List of matching CityInfo objects
         """
-        cities = self.get_cities()
-        matches = []
+        return self._find_city_in(self._ensure_city_index(), city_name, exact_match)
 
+    def _find_city_in(
+        self, index: _CityIndex, city_name: str, exact_match: bool
+    ) -> List[CityInfo]:
+        """find_city over one city index snapshot."""
+        cities = index.cities
         search_term = city_name.lower().strip()
 
-        for city in cities:
-            city_display = city.display_name.lower()
-            city_clean = city.clean_name.lower() if city.clean_name else ""
-
-            if exact_match:
-                if search_term == city_display or search_term == city_clean:
-                    matches.append(city)
-            else:
-                if (
-                    search_term in city_display
-                    or search_term in city_clean
-                    or city_display.startswith(search_term)
-                    or city_clean.startswith(search_term)
-                ):
-                    matches.append(city)
+        if exact_match:
+            return list(index.by_exact.get(search_term, ()))
+        if not cities or "\0" in search_term:
+            return []
 
+        # Substring search (a prefix match is also a substring match) as
+        # str.find scans over one string; each hit is mapped back to its city,
+        # then the scan resumes at the next city's first entry.
+        blob, starts = index.blob, index.starts
+        matches = []
+        pos = blob.find(search_term)
+        while pos >= 0:
+            i = (bisect_right(starts, pos) - 1) // 2
+            matches.append(cities[i])
+            next_entry = 2 * (i + 1)
+            if next_entry >= len(starts):
+                break
+            pos = blob.find(search_term, starts[next_entry])
         return matches
 
     def get_city_by_id(self, city_id: int) -> Optional[CityInfo]:
@@ -123,11 +227,7 @@ class IMDWeatherClient:
         Returns:
             CityInfo object or None if not found
         """
-        cities = self.get_cities()
-        for city in cities:
-            if city.city_id == city_id:
-                return city
-        return None
+        return self._ensure_city_index().by_id.get(city_id)
 
     def get_current_weather(self, city_identifier: Union[int, str]) -> WeatherData:
         """
@@ -151,9 +251,7 @@ class IMDWeatherClient:
             return json_result
 
         try:
-            url = f"{self.weather_url_prefix}{city_id}"
-            response = safe_get(url)
-            weather_data = self.parser.parse_past_24_hours(response.text)
+            weather_data = self.parser.parse_past_24_hours(self._fetch_html(city_id))
             weather_data.city_id = city_id
             return weather_data
         except NetworkError:
@@ -183,9 +281,7 @@ class IMDWeatherClient:
             return json_result
 
         try:
-            url = f"{self.weather_url_prefix}{city_id}"
-            response = safe_get(url)
-            forecast_data = self.parser.parse_forecast_table(response.text)
+            forecast_data = self.parser.parse_forecast_table(self._fetch_html(city_id))
             forecast_data.city_id = city_id
             return forecast_data
         except NetworkError:
@@ -219,13 +315,11 @@ class IMDWeatherClient:
             return json_result
 
         try:
-            url = f"{self.weather_url_prefix}{city_id}"
-            response = safe_get(url)
-
-            weather_data = self.parser.parse_past_24_hours(response.text)
+            # One tree for both tables rather than parsing the page twice
+            weather_data, forecast_data = self.parser.parse_weather_page(
+                self._fetch_html(city_id)
+            )
             weather_data.city_id = city_id
-
-            forecast_data = self.parser.parse_forecast_table(response.text)
             forecast_data.city_id = city_id
 
             return weather_data, forecast_data
@@ -234,6 +328,94 @@ class IMDWeatherClient:
         except Exception as e:
             raise IMDWeatherError(f"Failed to get complete weather data: {str(e)}")
 
+    def get_many_current_weather(
+        self,
+        city_identifiers: Iterable[Union[int, str]],
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> List[Union[WeatherData, IMDWeatherError]]:
+        """
+        Get current weather for several cities concurrently
+
+        Requests run on a thread pool over this client's (pooled) session, so
+        they share keep-alive connections to the IMD host.
+
+        Args:
+            city_identifiers: City IDs (int) and/or city names (str)
+            max_workers: Maximum number of concurrent requests
+            return_exceptions: Return a failed city's IMDWeatherError in its
+                slot instead of raising it
+
+        Returns:
+            List of WeatherData objects, in the order of city_identifiers
+        """
+        # Warm the city list once so worker threads don't each fetch it.
+        self.get_cities()
+
+        def fetch(city_identifier: Union[int, str]) -> Any:
+            try:
+                return self.get_current_weather(city_identifier)
+            except IMDWeatherError as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, city_identifiers))
+
+    def get_weather_batch(
+        self,
+        city_identifiers: Iterable[Union[int, str]],
+        max_concurrency: int = 8,
+    ) -> "pd.DataFrame":
+        """
+        Get current weather for several cities as one DataFrame
+
+        Cities are fetched concurrently (see get_many_current_weather). A city
+        that fails gets a row with status "error" and the message in "error"
+        instead of aborting the batch.
+
+        Args:
+            city_identifiers: City IDs (int) and/or city names (str)
+            max_concurrency: Maximum number of concurrent requests
+
+        Returns:
+            DataFrame with one row per identifier: query, city_id, city, date,
+            status, error, plus one column per WEATHER_PARAM_NAMES key
+            (max_temp, min_temp, rainfall, rh_0830, ...)
+        """
+        import pandas as pd
+
+        identifiers = list(city_identifiers)
+        results = self.get_many_current_weather(
+            identifiers, max_workers=max_concurrency, return_exceptions=True
+        )
+
+        param_keys = {name: key for key, name in WEATHER_PARAM_NAMES.items()}
+        rows: List[Dict[str, Any]] = []
+        for identifier, result in zip(identifiers, results):
+            if isinstance(result, IMDWeatherError):
+                rows.append(
+                    {"query": identifier, "status": "error", "error": str(result)}
+                )
+                continue
+
+            row = {
+                "query": identifier,
+                "city_id": result.city_id,
+                "city": result.city,
+                "date": result.date,
+                "status": "success",
+            }
+            for param in result.parameters:
+                key = param_keys.get(param.parameter)
+                if key is not None:
+                    row[key] = param.value
+            rows.append(row)
+
+        columns = ["query", "city_id", "city", "date", "status", "error"]
+        return pd.DataFrame(rows, columns=columns + list(WEATHER_PARAM_NAMES))
+
     @staticmethod
     def _weather_from_json(rec: Dict, city_id: int) -> WeatherData:
         """Build a WeatherData (current conditions) from a fetchCity_static record.
@@ -321,14 +503,46 @@ class IMDWeatherClient:
             pass
         return None
 
+    def _cached(self, kind: str, city_id: int, fetch: Callable[[], _T]) -> _T:
+        """Return ``fetch()``, reusing a result for (kind, city_id) that is
+        younger than RESPONSE_CACHE_TTL. Failed fetches are not cached."""
+        key = (kind, city_id)
+        now = time.monotonic()
+        with self._response_cache_lock:
+            hit = self._response_cache.get(key)
+            if hit is not None and now - hit[0] < RESPONSE_CACHE_TTL:
+                return cast(_T, hit[1])
+
+        value = fetch()
+
+        with self._response_cache_lock:
+            self._response_cache.pop(key, None)
+            self._response_cache[key] = (now, value)
+            while len(self._response_cache) > RESPONSE_CACHE_MAXSIZE:
+                # dicts keep insertion order: evict the oldest entry
+                del self._response_cache[next(iter(self._response_cache))]
+        return value
+
+    def _fetch_html(self, city_id: int) -> str:
+        """Fetch a station's legacy HTML weather page (cached, see _cached)."""
+        url = f"{self.weather_url_prefix}{city_id}"
+        return self._cached(
+            "html", city_id, lambda: safe_get(url, session=self.session).text
+        )
+
     def _fetch_city_static(self, city_id: int) -> Optional[Dict]:
         """Fetch a station's record from the responsive JSON API (incl. lat/lon)."""
-        resp = safe_post(
-            CITY_STATIC_API_URL,
-            data={"ID": city_id},
-            extra_headers={"Referer": CITY_STATIC_REFERER},
-        )
-        payload = resp.json()
+
+        def fetch() -> Any:
+            resp = safe_post(
+                CITY_STATIC_API_URL,
+                data={"ID": city_id},
+                extra_headers={"Referer": CITY_STATIC_REFERER},
+                session=self.session,
+            )
+            return resp.json()
+
+        payload = self._cached("json", city_id, fetch)
         rec = payload[0] if isinstance(payload, list) and payload else payload
         return rec if isinstance(rec, dict) else None
 
@@ -431,7 +645,7 @@ class IMDWeatherClient:
         errors = []
         for url in IP_GEOLOCATION_URLS:
             try:
-                response = safe_get(url, max_retries=0, timeout=5)
+                response = safe_get(url, max_retries=0, timeout=5, session=self.session)
                 rec = response.json()
             except Exception as e:
                 errors.append(f"{url}: {e}")
@@ -481,25 +695,39 @@ class IMDWeatherClient:
         city = self.get_nearest_city(latitude, longitude)
         return self.get_current_weather(city.city_id)
 
-    def get_cities_dataframe(self) -> pd.DataFrame:
+    def get_cities_dataframe(self) -> "pd.DataFrame":
         """
         Get cities as a pandas DataFrame
 
+        The frame is built once per fetched city list; each call returns a copy.
+
         Returns:
-            DataFrame with city information
+            DataFrame with city information (int32 ids, string-dtype names)
         """
-        cities = self.get_cities()
-        data = []
-        for city in cities:
-            data.append(
+        cities = self._ensure_city_index().cities
+        cached = self._cities_frame
+        if cached is None or cached[0] is not cities:
+            import numpy as np
+            import pandas as pd
+
+            frame = pd.DataFrame(
                 {
-                    "city_id": city.city_id,
-                    "display_name": city.display_name,
-                    "clean_name": city.clean_name,
-                    "full_value": city.full_value,
+                    "city_id": np.fromiter(
+                        (c.city_id for c in cities), dtype=np.int32, count=len(cities)
+                    ),
+                    "display_name": pd.array(
+                        [c.display_name for c in cities], dtype="string"
+                    ),
+                    "clean_name": pd.array(
+                        [c.clean_name for c in cities], dtype="string"
+                    ),
+                    "full_value": pd.array(
+                        [c.full_value for c in cities], dtype="string"
+                    ),
                 }
             )
-        return pd.DataFrame(data)
+            cached = self._cities_frame = (cities, frame)
+        return cached[1].copy()
 
     def _resolve_city_id(self, city_identifier: Union[int, str]) -> int:
         """
@@ -514,20 +742,31 @@ class IMDWeatherClient:
         Raises:
             CityNotFoundError: If city is not found
         """
+        index = self._ensure_city_index()
+        city_id = index.resolved.get(city_identifier)
+        if city_id is None:
+            city_id = self._match_city_id(index, city_identifier)
+            index.resolved[city_identifier] = city_id
+        return city_id
+
+    def _match_city_id(
+        self, index: _CityIndex, city_identifier: Union[int, str]
+    ) -> int:
+        """Uncached body of _resolve_city_id, over one city index snapshot."""
         if isinstance(city_identifier, int):
-            city = self.get_city_by_id(city_identifier)
-            if not city:
+            if city_identifier not in index.by_id:
                 raise CityNotFoundError(f"City with ID {city_identifier} not found")
             return city_identifier
 
-        matches = self.find_city(city_identifier)
+        matches = self._find_city_in(index, city_identifier, exact_match=False)
         if not matches:
             raise CityNotFoundError(f"No cities found matching '{city_identifier}'")
 
         if len(matches) == 1:
             return matches[0].city_id
 
-        exact_matches = self.find_city(city_identifier, exact_match=True)
+        # Exact matches are a subset of the fuzzy ones: a single dict lookup.
+        exact_matches = index.by_exact.get(city_identifier.lower().strip(), [])
         if len(exact_matches) == 1:
             return exact_matches[0].city_id
 
@@ -2,6 +2,11 @@
 Constants used throughout the IMD Weather package
 """
 
+import re
+from typing import List, Pattern, Tuple
+
+from urllib3.util.request import ACCEPT_ENCODING
+
 # URLs
 BASE_URL = "https://internal.imd.gov.in"
 CITY_LIST_URL = f"{BASE_URL}/pages/city_weather_main_mausam.php"
@@ -28,10 +33,23 @@ INDIA_BBOX = (6.0, 38.0, 67.0, 99.0)
 DEFAULT_TIMEOUT = 10
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 1.0
+# Status codes worth retrying (rate limiting and transient server errors)
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+# Connection pooling for the shared requests.Session (see imdfetch.http)
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Per-client cache of fetched station pages/records, so calling
+# get_current_weather and get_forecast for one city downloads it once.
+RESPONSE_CACHE_TTL = 300  # seconds
+RESPONSE_CACHE_MAXSIZE = 256
 
-# Headers
+# Headers. ACCEPT_ENCODING is "gzip,deflate" plus br/zstd only when urllib3 has
+# a decoder for them installed, so compressed bodies are always decodable.
 DEFAULT_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
 # Date formats
@@ -50,6 +68,51 @@ DATE_FORMATS = [
     "%b %d %Y",  # May 27 2025
 ]
 
+# Input formats accepted by dates.format_date
+FORMAT_DATE_INPUTS = [
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%d %b %Y",
+    "%d %B %Y",
+]
+
+# strptime directive -> regex loose enough to accept anything strptime would
+_PROBE_DIRECTIVES = {
+    "d": r"[ \d]?\d",
+    "m": r"[ \d]?\d",
+    "y": r"\d\d",
+    "Y": r"\d{4}",
+    "b": r"[A-Za-z]+",
+    "B": r"[A-Za-z]+",
+}
+
+
+def _date_format_probe(fmt: str) -> Pattern[str]:
+    """Structural regex a string must fullmatch for strptime(fmt) to succeed.
+
+    Checking it first skips strptime calls (and their ValueError) for formats
+    that cannot possibly match.
+    """
+    parts = re.split(r"(%.)", fmt)
+    pattern = "".join(
+        (
+            _PROBE_DIRECTIVES[part[1]]
+            if part.startswith("%")
+            else re.sub(r"\\\s+", r"\\s+", re.escape(part))
+        )
+        for part in parts
+    )
+    return re.compile(pattern)
+
+
+DATE_FORMAT_PROBES: List[Tuple[Pattern[str], str]] = [
+    (_date_format_probe(fmt), fmt) for fmt in DATE_FORMATS
+]
+FORMAT_DATE_PROBES: List[Tuple[Pattern[str], str]] = [
+    (_date_format_probe(fmt), fmt) for fmt in FORMAT_DATE_INPUTS
+]
+
 # Month abbreviations
 MONTH_ABBREV = {
     "jan": "01",
@@ -1,22 +1,40 @@
 """Date parsing and formatting helpers for IMD pages."""
 
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
-from .constants import DATE_FORMATS, MONTH_ABBREV
+from .constants import DATE_FORMAT_PROBES, FORMAT_DATE_PROBES, MONTH_ABBREV
 
 __all__ = ["parse_date", "convert_date_to_iso", "format_date"]
 
+_DATE_JUNK_RE = re.compile(r"[^\w\s\/\-,:]")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Only the first three letters of the month are read, so "Jan." and "January"
+# both match, as they always have
+_DAY_MONTH_RE = re.compile(r"(\d{1,2})[-\s]+([A-Za-z]{3}[^-\s]*)")
 
+
+@lru_cache(maxsize=1024)
 def parse_date(date_text: str) -> Optional[str]:
     """Parse common IMD date formats into YYYY-MM-DD, or None if unrecognized."""
     if not date_text:
         return None
 
-    date_text = re.sub(r"[^\w\s\/\-,:]", "", date_text.strip())
+    date_text = date_text.strip()
+    if _ISO_DATE_RE.fullmatch(date_text):  # Already YYYY-MM-DD: just validate
+        try:
+            date.fromisoformat(date_text)
+        except ValueError:
+            return None
+        return date_text
 
-    for fmt in DATE_FORMATS:
+    date_text = _DATE_JUNK_RE.sub("", date_text)
+
+    for probe, fmt in DATE_FORMAT_PROBES:
+        if not probe.fullmatch(date_text):
+            continue
         try:
             parsed_date = datetime.strptime(date_text, fmt)
             return parsed_date.strftime("%Y-%m-%d")
@@ -30,46 +48,46 @@ def convert_date_to_iso(date_str: str) -> Optional[str]:
     """Convert "DD-MMM" (e.g. "27-May") to YYYY-MM-DD using the current year."""
     if not date_str:
         return None
+    # The year is part of the cache key so results don't go stale at New Year
+    return _convert_date_to_iso(date_str, datetime.now().year)
 
-    current_year = datetime.now().year
-
-    try:
-        parts = date_str.strip().replace("-", " ").replace("  ", " ").split(" ")
-        if len(parts) != 2:
-            return None
-
-        day, month_abbr = parts
-        day = day.zfill(2)
-
-        month_key = month_abbr.lower()[:3]
-        if month_key not in MONTH_ABBREV:
-            return None
 
-        month = MONTH_ABBREV[month_key]
-        return f"{current_year}-{month}-{day}"
+@lru_cache(maxsize=1024)
+def _convert_date_to_iso(date_str: str, current_year: int) -> Optional[str]:
+    match = _DAY_MONTH_RE.fullmatch(date_str.strip())
+    if not match:
+        return None
 
-    except Exception:
+    day, month_abbr = match.groups()
+    month = MONTH_ABBREV.get(month_abbr.lower()[:3])
+    if month is None:
         return None
+    return f"{current_year}-{month}-{day.zfill(2)}"
 
 
+@lru_cache(maxsize=1024)
 def format_date(date_str: str, include_day: bool = True) -> str:
     """Format a date string as "25 May, 2027 (Tuesday)"; pass through on failure."""
-    date_formats = [
-        "%Y-%m-%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-        "%d %b %Y",
-        "%d %B %Y",
-    ]
-
-    for fmt in date_formats:
+    text = date_str.strip()
+    date_obj: Optional[datetime] = None
+    if _ISO_DATE_RE.fullmatch(text):  # Common case: no strptime needed
         try:
-            date_obj = datetime.strptime(date_str.strip(), fmt)
-            formatted = date_obj.strftime("%d %B, %Y")
-            if include_day:
-                formatted += f" ({date_obj.strftime('%A')})"
-            return formatted
+            date_obj = datetime.fromisoformat(text)
         except ValueError:
-            continue
-
-    return date_str
+            return date_str
+    else:
+        for probe, fmt in FORMAT_DATE_PROBES:
+            if not probe.fullmatch(text):
+                continue
+            try:
+                date_obj = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+
+    if date_obj is None:
+        return date_str
+    formatted = date_obj.strftime("%d %B, %Y")
+    if include_day:
+        formatted += f" ({date_obj.strftime('%A')})"
+    return formatted
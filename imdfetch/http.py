@@ -1,25 +1,123 @@
 """HTTP layer: retrying GET/POST with an SSL-verification fallback."""
 
+import asyncio
 import logging
-import time
-from typing import Optional
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .constants import (
     DEFAULT_BACKOFF_FACTOR,
     DEFAULT_HEADERS,
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    RETRY_STATUS_FORCELIST,
 )
 from .exceptions import NetworkError
 
+if TYPE_CHECKING:  # BaseHTTPResponse is urllib3 2.x only; 1.26 is still supported
+    from urllib3 import BaseHTTPResponse
+    from urllib3.connectionpool import ConnectionPool
+
 logger = logging.getLogger(__name__)
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-__all__ = ["make_robust_request", "safe_get", "safe_post"]
+__all__ = [
+    "make_robust_request",
+    "safe_get",
+    "safe_post",
+    "fetch_many",
+    "safe_get_many",
+    "new_session",
+]
+
+
+class _JitteredRetry(Retry):
+    """Retry whose exponential backoff gets up to ``backoff_factor`` seconds of
+    random jitter, so concurrent callers that fail together don't retry in
+    lockstep. The immediate first retry stays immediate.
+
+    SSL errors are never retried: a bad certificate won't fix itself, and
+    _request's verify=False fallback should kick in straight away.
+    """
+
+    def increment(
+        self,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        response: Optional["BaseHTTPResponse"] = None,
+        error: Optional[Exception] = None,
+        _pool: Optional["ConnectionPool"] = None,
+        _stacktrace: Optional[TracebackType] = None,
+    ) -> "_JitteredRetry":
+        if isinstance(error, urllib3.exceptions.SSLError):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, self.backoff_factor)
+
+
+def new_session(max_retries: int = DEFAULT_MAX_RETRIES) -> requests.Session:
+    """A requests.Session with a keep-alive connection pool sized for batch use.
+
+    Sessions are safe to share across threads for the GET/POST calls made
+    here; reusing one avoids a TCP + TLS handshake per request. Connection
+    errors and retryable status codes are retried inside urllib3, with
+    jittered exponential backoff, up to ``max_retries`` times.
+    """
+    retry = _JitteredRetry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        backoff_factor=DEFAULT_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        respect_retry_after_header=True,
+        # The POSTs made here are read-only lookups, so they are safe to retry
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)  # ip-api.com geolocation is plain HTTP
+    return session
+
+
+# Module-wide default, shared by every IMDWeatherClient that is not handed
+# its own session.
+_SESSION = new_session()
+
+# Shared sessions for callers asking for a non-default retry count; the retry
+# policy lives on the adapter, so each count needs its own session.
+_SESSIONS: Dict[int, requests.Session] = {DEFAULT_MAX_RETRIES: _SESSION}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _shared_session(max_retries: int) -> requests.Session:
+    """The shared pooled session whose adapter retries ``max_retries`` times."""
+    session = _SESSIONS.get(max_retries)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.setdefault(max_retries, new_session(max_retries))
+    return session
 
 
 def _request(
@@ -29,46 +127,31 @@ def _request(
     extra_headers: Optional[dict] = None,
     max_retries: int = DEFAULT_MAX_RETRIES,
     timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     """Issue an HTTP request with retry + SSL-verification fallback.
+
+    Retries happen in the session's urllib3 adapter. An explicit ``session``
+    keeps its own retry policy and ``max_retries`` is not applied to it.
     """
+    sess = session or _shared_session(max_retries)
     headers = {**DEFAULT_HEADERS, **(extra_headers or {})}
-    last_err: Optional[Exception] = None
-    for attempt in range(max_retries + 1):
-        for verify in (True, False):
-            try:
-                resp = requests.request(
-                    method,
-                    url,
-                    data=data,
-                    headers=headers,
-                    timeout=timeout,
-                    verify=verify,
-                )
-                resp.raise_for_status()
-                return resp
-            except requests.exceptions.SSLError as e:
-                last_err = e
-                logger.warning(
-                    "SSL error for %s %s; retrying without verification", method, url
-                )
-                continue
-            except requests.exceptions.RequestException as e:
-                last_err = e
-                logger.warning(
-                    "Request error on attempt %d/%d for %s %s: %s",
-                    attempt + 1,
-                    max_retries + 1,
-                    method,
-                    url,
-                    e,
-                )
-                break
-        if attempt < max_retries:
-            time.sleep(DEFAULT_BACKOFF_FACTOR * (2**attempt))
-    raise NetworkError(
-        f"{method} {url} failed after {max_retries + 1} attempts: {last_err}"
-    )
+    try:
+        try:
+            resp = sess.request(
+                method, url, data=data, headers=headers, timeout=timeout, verify=True
+            )
+        except requests.exceptions.SSLError:
+            logger.warning(
+                "SSL error for %s %s; retrying without verification", method, url
+            )
+            resp = sess.request(
+                method, url, data=data, headers=headers, timeout=timeout, verify=False
+            )
+        resp.raise_for_status()
+        return resp
+    except requests.exceptions.RequestException as e:
+        raise NetworkError(f"{method} {url} failed: {e}") from e
 
 
 def make_robust_request(
@@ -77,17 +160,25 @@ def make_robust_request(
     backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
     timeout: int = DEFAULT_TIMEOUT,
     verify_ssl: bool = True,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     """GET with retry and SSL fallback. ``backoff_factor``/``verify_ssl`` are
     accepted for backward compatibility; the SSL fallback is always applied."""
-    return _request("GET", url, max_retries=max_retries, timeout=timeout)
+    return _request(
+        "GET", url, max_retries=max_retries, timeout=timeout, session=session
+    )
 
 
 def safe_get(
-    url: str, max_retries: int = DEFAULT_MAX_RETRIES, timeout: int = DEFAULT_TIMEOUT
+    url: str,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
-    """requests.get() with retry logic."""
-    return _request("GET", url, max_retries=max_retries, timeout=timeout)
+    """requests.get() with retry logic, over the shared pooled session."""
+    return _request(
+        "GET", url, max_retries=max_retries, timeout=timeout, session=session
+    )
 
 
 def safe_post(
@@ -96,6 +187,7 @@ def safe_post(
     extra_headers: Optional[dict] = None,
     max_retries: int = DEFAULT_MAX_RETRIES,
     timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     """POST a form-encoded body with retry + SSL fallback (mirrors safe_get)."""
     return _request(
@@ -105,4 +197,55 @@ def safe_post(
         extra_headers=extra_headers,
         max_retries=max_retries,
         timeout=timeout,
+        session=session,
     )
+
+
+def fetch_many(
+    urls: Iterable[str],
+    max_workers: int = 8,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, requests.Response]:
+    """safe_get() several URLs concurrently over one pooled session.
+
+    Returns responses keyed by URL, in first-seen order; raises NetworkError
+    for the first URL (in that order) that fails.
+    """
+    unique = list(dict.fromkeys(urls))
+
+    def fetch(url: str) -> requests.Response:
+        return safe_get(url, max_retries=max_retries, timeout=timeout, session=session)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(unique, executor.map(fetch, unique)))
+
+
+async def safe_get_many(
+    urls: Iterable[str],
+    max_workers: int = 8,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+) -> List[requests.Response]:
+    """Awaitable safe_get() of several URLs; responses in the order of ``urls``.
+
+    The blocking requests run on a private thread pool over the pooled
+    session, so this can be awaited from an event loop without stalling it.
+    """
+    loop = asyncio.get_running_loop()
+
+    def fetch(url: str) -> requests.Response:
+        return safe_get(url, max_retries=max_retries, timeout=timeout, session=session)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, fetch, url) for url in urls)
+            )
+        )
+    finally:
+        # Don't block the event loop on stragglers after a failure
+        executor.shutdown(wait=False)
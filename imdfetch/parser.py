@@ -3,10 +3,22 @@ HTML parsing functions for extracting weather data
 """
 
 import re
-from typing import Dict, List
+import sys
+from operator import attrgetter, itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+)
 
-import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from .exceptions import DataParsingError
 from .utils import (
@@ -17,12 +29,71 @@ from .utils import (
 )
 from .weather import CityInfo, ForecastData, ForecastDay, WeatherData, WeatherParameter
 
+if TYPE_CHECKING:  # pandas is imported lazily: it dominates CLI start-up time
+    import pandas as pd
+
+# First table, in document order, whose text contains the marker $text
+_TABLE_BY_TEXT = etree.XPath("(//table[contains(., $text)])[1]")
+_PAST_24_MARKER = "Past 24 Hours Weather Data"
+_FORECAST_MARKER = "7 Day's Forecast"
+# Substrings checked on the raw HTML before building a tree, so error pages
+# fail fast. The forecast marker's apostrophe may be an entity in the markup,
+# so only the text before it is required there ("Forecast" alone would match
+# every page's "Local Weather Report and Forecast For:" heading).
+_PAST_24_ANCHOR = _PAST_24_MARKER
+_FORECAST_ANCHOR = "7 Day"
+
+_CITY_ID_RE = re.compile(r"^(\d{4,6})")
+# City and date sit just after this heading; search a window there first
+_HEADER_ANCHOR = "Local Weather Report"
+_HEADER_WINDOW = 2048
+_FONT_CITY_RE = re.compile(
+    r"Local Weather Report and Forecast For:\s*</b>\s*"
+    r"<FONT[^>]*color\s*=\s*[\"\']?blue[\"\']?[^>]*>([^<]+)</Font>",
+    re.IGNORECASE,
+)
+_DATED_RE = re.compile(r"<B>Dated\s*:\s*([^<]+)</b>", re.IGNORECASE)
+_DATE_HEAD_RE = re.compile(r"\d{2}-[A-Za-z]{3}")
+
+
+def _city_options(html_content: str) -> Iterator[Tuple[int, str, str]]:
+    """Yield (city_id, display_name, full_value) for each city <option>."""
+    doc = lxml_html.fromstring(html_content)
+    options = doc.xpath("//option[@value]")
+
+    if not options:
+        raise DataParsingError("No city data found in HTML content")
+
+    for option in options:
+        full_value = option.get("value")
+        id_match = _CITY_ID_RE.match(full_value)
+        if id_match:
+            yield int(id_match.group(1)), option.text_content().strip(), full_value
+
+
+def _search_header(
+    pattern: Pattern[str], html_content: str, start: int
+) -> Optional[Match[str]]:
+    """Search the window after the page heading, then the whole document."""
+    if start >= 0:
+        match = pattern.search(html_content, start, start + _HEADER_WINDOW)
+        if match:
+            return match
+    return pattern.search(html_content)
+
+
+def _cell_text(cell: "lxml_html.HtmlElement") -> str:
+    """Text of a cell with each string stripped, as BS4's get_text(strip=True)."""
+    if not len(cell):  # Plain-text cell (the common case): one C-level read
+        return (cell.text or "").strip()
+    return "".join(text.strip() for text in cell.itertext())
+
 
 class WeatherDataParser:
     """Parser for IMD weather data"""
 
     @staticmethod
-    def parse_city_list(html_content: str) -> pd.DataFrame:
+    def parse_city_list(html_content: str) -> List[Dict[str, Any]]:
         """
         Extract city list from IMD main page
 
@@ -30,43 +101,81 @@ class WeatherDataParser:
             html_content: HTML content containing city options
 
         Returns:
-            DataFrame with city information
+            List of dicts with city_id, display_name and full_value keys,
+            sorted by city_id
 
         Raises:
             DataParsingError: If parsing fails
         """
         try:
-            raw_data = []
-            option_pattern = r"<option value='(\d+)([^']*)'>(.*?)</option>"
+            raw_data = [
+                {
+                    "city_id": city_id,
+                    "display_name": display_name,
+                    "full_value": full_value,
+                }
+                for city_id, display_name, full_value in _city_options(html_content)
+            ]
+            raw_data.sort(key=itemgetter("city_id"))
+            return raw_data
 
-            matches = re.findall(option_pattern, html_content)
+        except Exception as e:
+            raise DataParsingError(f"Failed to parse city list: {str(e)}")
 
-            if not matches:
-                raise DataParsingError("No city data found in HTML content")
+    @staticmethod
+    def parse_city_list_as_cityinfo(html_content: str) -> List[CityInfo]:
+        """
+        Extract city list from IMD main page as CityInfo objects
 
-            for match in matches:
-                full_value = match[0] + match[1]
-                display_name = match[2]
+        Same cities and order as parse_city_list, built in a single pass with
+        the cleaned name filled in.
 
-                id_match = re.match(r"^(\d{4,6})", full_value)
-                if id_match:
-                    city_id = int(id_match.group(1))
-                    clean_name = display_name.strip()
+        Args:
+            html_content: HTML content containing city options
 
-                    raw_data.append(
-                        {
-                            "city_id": city_id,
-                            "display_name": clean_name,
-                            "full_value": full_value,
-                        }
-                    )
+        Returns:
+            List of CityInfo objects, sorted by city_id
 
-            raw_data.sort(key=lambda x: x["city_id"])
-            return pd.DataFrame(raw_data)
+        Raises:
+            DataParsingError: If parsing fails
+        """
+        try:
+            cities = []
+            for city_id, display_name, full_value in _city_options(html_content):
+                # Interned so repeated fetches of the list share one copy per name
+                clean_name = clean_city_name(display_name)
+                cities.append(
+                    CityInfo(
+                        city_id=city_id,
+                        display_name=sys.intern(display_name),
+                        full_value=sys.intern(full_value),
+                        clean_name=sys.intern(clean_name) if clean_name else clean_name,
+                    )
+                )
+            cities.sort(key=attrgetter("city_id"))
+            return cities
 
         except Exception as e:
             raise DataParsingError(f"Failed to parse city list: {str(e)}")
 
+    @staticmethod
+    def parse_city_list_as_dataframe(html_content: str) -> "pd.DataFrame":
+        """
+        Extract city list from IMD main page as a DataFrame
+
+        Args:
+            html_content: HTML content containing city options
+
+        Returns:
+            DataFrame with city information
+
+        Raises:
+            DataParsingError: If parsing fails
+        """
+        import pandas as pd
+
+        return pd.DataFrame(WeatherDataParser.parse_city_list(html_content))
+
     @staticmethod
     def parse_city_and_date(html_content: str) -> Dict[str, str]:
         """
@@ -79,16 +188,15 @@ class WeatherDataParser:
             Dictionary with city and date information
         """
         result = {}
+        start = html_content.find(_HEADER_ANCHOR)
 
-        font_city_pattern = r'Local Weather Report and Forecast For:\s*</b>\s*<FONT[^>]*color\s*=\s*["\']?blue["\']?[^>]*>([^<]+)</Font>'
-        match = re.search(font_city_pattern, html_content, re.IGNORECASE)
+        match = _search_header(_FONT_CITY_RE, html_content, start)
         if match:
             city_text = match.group(1).strip()
             result["city"] = clean_city_name(city_text)
             result["raw_city_text"] = city_text
 
-        dated_b_pattern = r"<B>Dated\s*:\s*([^<]+)</b>"
-        match = re.search(dated_b_pattern, html_content, re.IGNORECASE)
+        match = _search_header(_DATED_RE, html_content, start)
         if match:
             date_text = match.group(1).strip()
             parsed_date = parse_date(date_text)
@@ -113,55 +221,11 @@ class WeatherDataParser:
             DataParsingError: If parsing fails
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            city_date_info = WeatherDataParser.parse_city_and_date(html_content)
-
-            past_24_table = None
-            for table in soup.find_all("table"):
-                if "Past 24 Hours Weather Data" in table.get_text():
-                    past_24_table = table
-                    break
-
-            if not past_24_table:
+            if _PAST_24_ANCHOR not in html_content:
                 raise DataParsingError("Past 24 Hours Weather Data table not found")
-
-            rows = past_24_table.find_all("tr")
-            parameters = []
-
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-
-                if len(cells) != 2:
-                    continue
-
-                param_text = cells[0].get_text(strip=True)
-                value_text = cells[1].get_text(strip=True)
-
-                if (
-                    "Past 24 Hours Weather Data" in param_text
-                    or not param_text
-                    or not value_text
-                ):
-                    continue
-
-                clean_param = clean_parameter_name(param_text)
-                parameters.append(
-                    WeatherParameter(
-                        parameter=clean_param,
-                        value=value_text,
-                        raw_parameter=param_text,
-                    )
-                )
-
-            return WeatherData(
-                city=city_date_info.get("city", "Unknown"),
-                date=city_date_info.get("date", ""),
-                raw_city_text=city_date_info.get("raw_city_text"),
-                raw_date_text=city_date_info.get("raw_date_text"),
-                parameters=parameters,
-            )
-
+            root = lxml_html.fromstring(html_content)
+            city_date_info = WeatherDataParser.parse_city_and_date(html_content)
+            return WeatherDataParser._past_24_hours_from_tree(root, city_date_info)
         except Exception as e:
             raise DataParsingError(f"Failed to parse past 24 hours data: {str(e)}")
 
@@ -180,70 +244,160 @@ class WeatherDataParser:
             DataParsingError: If parsing fails
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-
+            if _FORECAST_ANCHOR not in html_content:
+                raise DataParsingError("7-day forecast table not found")
+            root = lxml_html.fromstring(html_content)
             city_date_info = WeatherDataParser.parse_city_and_date(html_content)
+            return WeatherDataParser._forecast_from_tree(root, city_date_info)
+        except Exception as e:
+            raise DataParsingError(f"Failed to parse forecast data: {str(e)}")
 
-            forecast_table = None
-            for table in soup.find_all("table"):
-                if "7 Day's Forecast" in table.get_text():
-                    forecast_table = table
-                    break
-            if not forecast_table:
-                raise DataParsingError("7-day forecast table not found")
+    @staticmethod
+    def parse_weather_page(html_content: str) -> Tuple[WeatherData, ForecastData]:
+        """
+        Extract both the Past 24 Hours data and the 7-day forecast
 
-            rows = forecast_table.find_all("tr")
-            header_row = None
-            for i, row in enumerate(rows):
-                row_text = row.get_text()
-                if "Date" in row_text and (
-                    "Min Temp" in row_text or "Max Temp" in row_text
-                ):
-                    header_row = i
-                    break
-
-            if header_row is None:
-                raise DataParsingError("Header row not found in forecast table")
-
-            forecast_days = []
-            for row in rows[(header_row + 1) :]:
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 7:
-                    cell_texts = [cell.get_text(strip=True) for cell in cells]
-                    if len(cell_texts) >= 9:
-                        date = cell_texts[0]
-                        min_temp = cell_texts[1]
-                        max_temp = cell_texts[2]
-                        # Skip image cell (cell_texts[3])
-                        forecast = cell_texts[4]
-                        # Skip warning image cell (cell_texts[5])
-                        warnings = cell_texts[6]
-                        rh_0830 = cell_texts[7]
-                        rh_1730 = cell_texts[8]
-                        if date and re.match(r"\d{2}-[A-Za-z]{3}", date):
-                            iso_date = convert_date_to_iso(date)
-                            forecast_days.append(
-                                ForecastDay(
-                                    date=date,
-                                    min_temp=min_temp,
-                                    max_temp=max_temp,
-                                    forecast=forecast,
-                                    warnings=warnings if warnings else None,
-                                    rh_0830=rh_0830 if rh_0830 else None,
-                                    rh_1730=rh_1730 if rh_1730 else None,
-                                    iso_date=iso_date,
-                                )
-                            )
+        Equivalent to calling parse_past_24_hours and parse_forecast_table, but
+        the page is parsed into a tree (and scanned for city/date) only once.
+
+        Args:
+            html_content: HTML content of a city weather page
+
+        Returns:
+            Tuple of (WeatherData, ForecastData)
 
-            return ForecastData(
-                city=city_date_info.get("city", "Unknown"),
-                forecast_date=city_date_info.get("date", ""),
-                days=forecast_days,
+        Raises:
+            DataParsingError: If parsing fails
+        """
+        if _PAST_24_ANCHOR not in html_content:
+            raise DataParsingError(
+                "Failed to parse past 24 hours data: "
+                "Past 24 Hours Weather Data table not found"
             )
+        if _FORECAST_ANCHOR not in html_content:
+            raise DataParsingError(
+                "Failed to parse forecast data: 7-day forecast table not found"
+            )
+
+        try:
+            root = lxml_html.fromstring(html_content)
+            city_date_info = WeatherDataParser.parse_city_and_date(html_content)
+        except Exception as e:
+            raise DataParsingError(f"Failed to parse weather page: {str(e)}")
+
+        try:
+            weather_data = WeatherDataParser._past_24_hours_from_tree(
+                root, city_date_info
+            )
+        except Exception as e:
+            raise DataParsingError(f"Failed to parse past 24 hours data: {str(e)}")
 
+        try:
+            forecast_data = WeatherDataParser._forecast_from_tree(root, city_date_info)
         except Exception as e:
             raise DataParsingError(f"Failed to parse forecast data: {str(e)}")
 
+        return weather_data, forecast_data
+
+    @staticmethod
+    def _past_24_hours_from_tree(
+        root: "lxml_html.HtmlElement", city_date_info: Dict[str, str]
+    ) -> WeatherData:
+        """Build WeatherData from an already-parsed weather page."""
+        tables = _TABLE_BY_TEXT(root, text=_PAST_24_MARKER)
+        if not tables:
+            raise DataParsingError("Past 24 Hours Weather Data table not found")
+
+        parameters = []
+
+        for row in tables[0].iter("tr"):
+            cells = list(row.iter("td", "th"))
+
+            if len(cells) != 2:
+                continue
+
+            param_text = _cell_text(cells[0])
+            value_text = _cell_text(cells[1])
+
+            if _PAST_24_MARKER in param_text or not param_text or not value_text:
+                continue
+
+            clean_param = clean_parameter_name(param_text)
+            parameters.append(
+                WeatherParameter(
+                    parameter=clean_param,
+                    value=value_text,
+                    raw_parameter=param_text,
+                )
+            )
+
+        return WeatherData(
+            city=city_date_info.get("city", "Unknown"),
+            date=city_date_info.get("date", ""),
+            raw_city_text=city_date_info.get("raw_city_text"),
+            raw_date_text=city_date_info.get("raw_date_text"),
+            parameters=parameters,
+        )
+
+    @staticmethod
+    def _forecast_from_tree(
+        root: "lxml_html.HtmlElement", city_date_info: Dict[str, str]
+    ) -> ForecastData:
+        """Build ForecastData from an already-parsed weather page."""
+        tables = _TABLE_BY_TEXT(root, text=_FORECAST_MARKER)
+        if not tables:
+            raise DataParsingError("7-day forecast table not found")
+
+        rows = list(tables[0].iter("tr"))
+        header_row = None
+        for i, row in enumerate(rows):
+            row_text = row.text_content()
+            if "Date" in row_text and (
+                "Min Temp" in row_text or "Max Temp" in row_text
+            ):
+                header_row = i
+                break
+
+        if header_row is None:
+            raise DataParsingError("Header row not found in forecast table")
+
+        forecast_days = []
+        for row in rows[(header_row + 1) :]:
+            cells = list(row.iter("td", "th"))
+            if len(cells) >= 7:
+                cell_texts = [_cell_text(cell) for cell in cells]
+                if len(cell_texts) >= 9:
+                    date = cell_texts[0]
+                    min_temp = cell_texts[1]
+                    max_temp = cell_texts[2]
+                    # Skip image cell (cell_texts[3])
+                    forecast = cell_texts[4]
+                    # Skip warning image cell (cell_texts[5])
+                    warnings = cell_texts[6]
+                    rh_0830 = cell_texts[7]
+                    rh_1730 = cell_texts[8]
+                    # Cheap "DD-" shape check before running the regex
+                    if date[2:3] == "-" and _DATE_HEAD_RE.match(date):
+                        iso_date = convert_date_to_iso(date)
+                        forecast_days.append(
+                            ForecastDay(
+                                date=date,
+                                min_temp=min_temp,
+                                max_temp=max_temp,
+                                forecast=forecast,
+                                warnings=warnings if warnings else None,
+                                rh_0830=rh_0830 if rh_0830 else None,
+                                rh_1730=rh_1730 if rh_1730 else None,
+                                iso_date=iso_date,
+                            )
+                        )
+
+        return ForecastData(
+            city=city_date_info.get("city", "Unknown"),
+            forecast_date=city_date_info.get("date", ""),
+            days=forecast_days,
+        )
+
     @staticmethod
     def get_cities_dataframe(html_content: str) -> List[CityInfo]:
         """
@@ -255,16 +409,4 @@ class WeatherDataParser:
         Returns:
             List of CityInfo objects
         """
-        df = WeatherDataParser.parse_city_list(html_content)
-        cities = []
-
-        for _, row in df.iterrows():
-            city_info = CityInfo(
-                city_id=row["city_id"],
-                display_name=row["display_name"],
-                full_value=row["full_value"],
-                clean_name=clean_city_name(row["display_name"]),
-            )
-            cities.append(city_info)
-
-        return cities
+        return WeatherDataParser.parse_city_list_as_cityinfo(html_content)
@@ -2,7 +2,9 @@
 
 import math
 import re
-from typing import List, Optional, Tuple, Union
+from bisect import bisect_right
+from functools import cache, lru_cache
+from typing import Any, List, Optional, Tuple, Union
 
 from .constants import WEATHER_PARAM_NAMES
 
@@ -11,6 +13,8 @@ __all__ = [
     "clean_parameter_name",
     "colorize_temperature",
     "colorize_humidity",
+    "colorize_temperature_array",
+    "colorize_humidity_array",
     "get_temperature_legend",
     "get_humidity_legend",
     "get_combined_legend",
@@ -26,7 +30,14 @@ _RED = "\033[91m"
 _BROWN = "\033[38;5;130m"
 _PURPLE = "\033[95m"
 
-_NA_VALUES = {"NA", "N/A", "-", "--", ""}
+_WHITESPACE_RE = re.compile(r"\s+")
+_PARENTHESIZED_RE = re.compile(r"\s*\([^)]*\)")
+_CITY_PREFIX_RE = re.compile(r"^(For|Weather|Report|Forecast):\s*", re.IGNORECASE)
+_CITY_SUFFIX_RE = re.compile(r"\s*(Weather|Report|Forecast)$", re.IGNORECASE)
+_ANGLE_BRACKETS_RE = re.compile(r"[<>]")
+_DROP_PARENS = str.maketrans("", "", "()")
+
+_NA_VALUES = frozenset({"NA", "N/A", "-", "--", ""})
 
 _TEMP_BANDS: List[Tuple[float, str, str]] = [
     (10, _BLUE, "< 10°C (Cold)"),
@@ -47,60 +58,70 @@ _HUMIDITY_BANDS: List[Tuple[float, str, str]] = [
 ]
 
 
+# Band lookup tables for _colorize: bisect_right(thresholds, v) is the index
+# of v's color (the last band's upper bound is math.inf, so it is left out).
+_TEMP_THRESHOLDS = tuple(upper for upper, _color, _label in _TEMP_BANDS[:-1])
+_TEMP_COLORS = tuple(color for _upper, color, _label in _TEMP_BANDS)
+_HUMIDITY_THRESHOLDS = tuple(upper for upper, _color, _label in _HUMIDITY_BANDS[:-1])
+_HUMIDITY_COLORS = tuple(color for _upper, color, _label in _HUMIDITY_BANDS)
+
+
+@lru_cache(maxsize=4096)
 def clean_city_name(city_text: str) -> Optional[str]:
     """Clean and standardize a city name, or None for empty input."""
     if not city_text:
         return None
 
-    city = re.sub(r"\s+", " ", city_text.strip())
-    city = re.sub(r"\s*\([^)]*\)", "", city)  # Remove space and parentheses content
-    city = re.sub(r"^(For|Weather|Report|Forecast):\s*", "", city, flags=re.IGNORECASE)
-    city = re.sub(r"\s*(Weather|Report|Forecast)$", "", city, flags=re.IGNORECASE)
-    city = re.sub(r"[<>]", "", city)
+    city = _WHITESPACE_RE.sub(" ", city_text.strip())
+    city = _PARENTHESIZED_RE.sub("", city)  # Remove space and parentheses content
+    city = _CITY_PREFIX_RE.sub("", city)
+    city = _CITY_SUFFIX_RE.sub("", city)
+    city = _ANGLE_BRACKETS_RE.sub("", city)
     city = city.title()
     city = city.replace(" -", "-")
     city = city.replace("- ", "-")
     return city.strip()
 
 
+# (label substring, canonical name), checked in order. A None name marks the
+# departure row, whose canonical name depends on max/min in the label.
+_PARAM_NEEDLES: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("Maximum Temp", WEATHER_PARAM_NAMES["max_temp"]),
+    ("Minimum Temp", WEATHER_PARAM_NAMES["min_temp"]),
+    ("Departure from Normal", None),
+    ("24 Hours Rainfall", WEATHER_PARAM_NAMES["rainfall"]),
+    ("Relative Humidity at 0830", WEATHER_PARAM_NAMES["rh_0830"]),
+    ("Relative Humidity at 1730", WEATHER_PARAM_NAMES["rh_1730"]),
+    ("Sunset", WEATHER_PARAM_NAMES["sunset"]),
+    ("Sunrise", WEATHER_PARAM_NAMES["sunrise"]),
+    ("Moonset", WEATHER_PARAM_NAMES["moonset"]),
+    ("Moonrise", WEATHER_PARAM_NAMES["moonrise"]),
+)
+
+
+@lru_cache(maxsize=1024)
 def clean_parameter_name(param_text: str) -> str:
     """Canonicalize an HTML parameter label to a name in WEATHER_PARAM_NAMES."""
-    param_text = param_text.replace("(", "").replace(")", "")
-    param_text = param_text.replace("  ", " ")
-
-    n = WEATHER_PARAM_NAMES
-    if "Maximum Temp" in param_text:
-        return n["max_temp"]
-    elif "Minimum Temp" in param_text:
-        return n["min_temp"]
-    elif "Departure from Normal" in param_text:
-        if "max" in param_text.lower():
+    param_text = param_text.translate(_DROP_PARENS).replace("  ", " ")
+
+    for needle, name in _PARAM_NEEDLES:
+        if needle not in param_text:
+            continue
+        if name is not None:
+            return name
+        lowered = param_text.lower()
+        if "max" in lowered:
             return "Max Temp Departure from Normal (°C)"
-        elif "min" in param_text.lower():
+        elif "min" in lowered:
             return "Min Temp Departure from Normal (°C)"
-        else:
-            return n["max_dep"]
-    elif "24 Hours Rainfall" in param_text:
-        return n["rainfall"]
-    elif "Relative Humidity at 0830" in param_text:
-        return n["rh_0830"]
-    elif "Relative Humidity at 1730" in param_text:
-        return n["rh_1730"]
-    elif "Sunset" in param_text:
-        return n["sunset"]
-    elif "Sunrise" in param_text:
-        return n["sunrise"]
-    elif "Moonset" in param_text:
-        return n["moonset"]
-    elif "Moonrise" in param_text:
-        return n["moonrise"]
-    else:
-        return param_text
+        return WEATHER_PARAM_NAMES["max_dep"]
+    return param_text
 
 
 def _colorize(
     value: Union[str, float],
-    bands: List[Tuple[float, str, str]],
+    thresholds: Tuple[float, ...],
+    colors: Tuple[str, ...],
     unit: str,
 ) -> str:
     """Wrap a numeric value in the ANSI color for its band; pass through N/A."""
@@ -112,10 +133,30 @@ def _colorize(
         except ValueError:
             return f"{value}{unit}"
 
-    for upper, color, _label in bands:
-        if value < upper:
-            return f"{color}{value}{unit}{_RESET}"
-    return f"{value}{unit}"  # unreachable: last band is math.inf
+    if not value < math.inf:  # NaN and +inf fall in no band
+        return f"{value}{unit}"
+    return f"{colors[bisect_right(thresholds, value)]}{value}{unit}{_RESET}"
+
+
+def _colorize_many(
+    values: Any,
+    thresholds: Tuple[float, ...],
+    colors: Tuple[str, ...],
+    unit: str,
+) -> List[str]:
+    """_colorize over an array-like, with the band search done by NumPy."""
+    import numpy as np  # imported lazily; the CLI's scalar path doesn't need it
+
+    arr = np.ravel(np.asarray(values))
+    if arr.dtype.kind not in "iuf":  # strings/objects: N/A handling per value
+        return [_colorize(v, thresholds, colors, unit) for v in arr.tolist()]
+
+    indices = np.searchsorted(thresholds, arr, side="right").tolist()
+    in_band = (arr < np.inf).tolist()  # NaN and +inf fall in no band
+    return [
+        f"{colors[i]}{v}{unit}{_RESET}" if ok else f"{v}{unit}"
+        for i, v, ok in zip(indices, arr.tolist(), in_band)
+    ]
 
 
 def _legend(title: str, bands: List[Tuple[float, str, str]]) -> str:
@@ -126,24 +167,37 @@ def _legend(title: str, bands: List[Tuple[float, str, str]]) -> str:
 
 def colorize_temperature(temp: Union[str, float], unit: str = "°C") -> str:
     """Color-code a temperature value with ANSI escape codes."""
-    return _colorize(temp, _TEMP_BANDS, unit)
+    return _colorize(temp, _TEMP_THRESHOLDS, _TEMP_COLORS, unit)
 
 
 def colorize_humidity(humidity: Union[str, float], unit: str = "%") -> str:
     """Color-code a relative-humidity value with ANSI escape codes."""
-    return _colorize(humidity, _HUMIDITY_BANDS, unit)
+    return _colorize(humidity, _HUMIDITY_THRESHOLDS, _HUMIDITY_COLORS, unit)
+
+
+def colorize_temperature_array(temps: Any, unit: str = "°C") -> List[str]:
+    """colorize_temperature for every value of an array-like, flattened."""
+    return _colorize_many(temps, _TEMP_THRESHOLDS, _TEMP_COLORS, unit)
+
+
+def colorize_humidity_array(humidities: Any, unit: str = "%") -> List[str]:
+    """colorize_humidity for every value of an array-like, flattened."""
+    return _colorize_many(humidities, _HUMIDITY_THRESHOLDS, _HUMIDITY_COLORS, unit)
 
 
+@cache
 def get_temperature_legend() -> str:
     """Legend for the temperature color coding."""
     return _legend("Temperature Color Legend", _TEMP_BANDS)
 
 
+@cache
 def get_humidity_legend() -> str:
     """Legend for the humidity color coding."""
     return _legend("Relative Humidity Color Legend", _HUMIDITY_BANDS)
 
 
+@cache
 def get_combined_legend() -> str:
     """Combined temperature + humidity legend."""
     return get_temperature_legend() + "\n\n" + get_humidity_legend()
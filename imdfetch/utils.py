@@ -6,12 +6,21 @@ existing ``from imdfetch.utils import ...`` imports keep working.
 """
 
 from .dates import convert_date_to_iso, format_date, parse_date
-from .http import make_robust_request, safe_get, safe_post
+from .http import (
+    fetch_many,
+    make_robust_request,
+    new_session,
+    safe_get,
+    safe_get_many,
+    safe_post,
+)
 from .textfmt import (
     clean_city_name,
     clean_parameter_name,
     colorize_humidity,
+    colorize_humidity_array,
     colorize_temperature,
+    colorize_temperature_array,
     get_combined_legend,
     get_humidity_legend,
     get_temperature_legend,
@@ -21,6 +30,9 @@ __all__ = [
     "make_robust_request",
     "safe_get",
     "safe_post",
+    "fetch_many",
+    "safe_get_many",
+    "new_session",
     "parse_date",
     "convert_date_to_iso",
     "format_date",
@@ -28,6 +40,8 @@ __all__ = [
     "clean_parameter_name",
     "colorize_temperature",
     "colorize_humidity",
+    "colorize_temperature_array",
+    "colorize_humidity_array",
     "get_temperature_legend",
     "get_humidity_legend",
     "get_combined_legend",
@@ -2,12 +2,33 @@
 Data models for weather information
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 instances keep a __dict__.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+class _Memoized:
+    """Base for models that memoize lookups in a slot of their own.
+
+    The cache is not a dataclass field, so it stays out of fields(), asdict(),
+    astuple(), ==, and repr(). Assigning any public attribute drops it.
+    """
+
+    __slots__ = ("_cache",)
+
+    _cache: Optional[Dict[str, Any]]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_cache", None)
+
+
+@dataclass(**_SLOTS)
 class CityInfo:
     """Information about a city/weather station"""
 
@@ -22,7 +43,7 @@ class CityInfo:
     station_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WeatherParameter:
     """Individual weather parameter with value"""
 
@@ -31,8 +52,8 @@ class WeatherParameter:
     raw_parameter: Optional[str] = None
 
 
-@dataclass
-class WeatherData:
+@dataclass(**_SLOTS)
+class WeatherData(_Memoized):
     """Current weather data for a location"""
 
     city: str
@@ -43,11 +64,44 @@ class WeatherData:
     parameters: List[WeatherParameter] = field(default_factory=list)
 
     def get_parameter(self, param_name: str) -> Optional[str]:
-        """Get value of a specific parameter"""
+        """Get value of a specific parameter
+
+        The first parameter whose name contains param_name (case-insensitive)
+        wins. Results are memoized per name, so repeated lookups skip the scan.
+        The memo is reset when parameters is reassigned, but not when the list
+        is edited in place (e.g. with append).
+        """
+        needle = param_name.lower()
+        lookups: Optional[Dict[str, Optional[str]]] = self._cache
+        if lookups is None:
+            lookups = self._cache = {}
+        elif needle in lookups:
+            return lookups[needle]
+
+        value = None
+        for param in self.parameters:
+            if needle in param.parameter.lower():
+                value = param.value
+                break
+        lookups[needle] = value
+        return value
+
+    def get_parameters(self, param_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get several parameters in one pass over the parameter list.
+
+        Matching is the same as get_parameter; missing names map to None.
+        """
+        pending = {name: name.lower() for name in param_names}
+        result: Dict[str, Optional[str]] = dict.fromkeys(pending)
         for param in self.parameters:
-            if param_name.lower() in param.parameter.lower():
-                return param.value
-        return None
+            if not pending:
+                break
+            lowered = param.parameter.lower()
+            for name, needle in list(pending.items()):
+                if needle in lowered:
+                    result[name] = param.value
+                    del pending[name]
+        return result
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -61,7 +115,7 @@ class WeatherData:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ForecastDay:
     """Single day forecast data"""
 
@@ -75,8 +129,8 @@ class ForecastDay:
     iso_date: Optional[str] = None
 
 
-@dataclass
-class ForecastData:
+@dataclass(**_SLOTS)
+class ForecastData(_Memoized):
     """Multi-day weather forecast"""
 
     city: str
@@ -85,11 +139,21 @@ class ForecastData:
     days: List[ForecastDay] = field(default_factory=list)
 
     def get_day_forecast(self, date: str) -> Optional[ForecastDay]:
-        """Get forecast for a specific date"""
-        for day in self.days:
-            if day.date == date or day.iso_date == date:
-                return day
-        return None
+        """Get forecast for a specific date
+
+        Matches either the display date ("01-Jun") or the ISO date; the first
+        matching day wins. Days are indexed by both on first use; the index is
+        reset when days is reassigned, but not when the list is edited in place.
+        """
+        by_date: Optional[Dict[str, ForecastDay]] = self._cache
+        if by_date is None:
+            by_date = {}
+            for day in self.days:
+                by_date.setdefault(day.date, day)
+                if day.iso_date:
+                    by_date.setdefault(day.iso_date, day)
+            self._cache = by_date
+        return by_date.get(date)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
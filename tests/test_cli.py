@@ -1,6 +1,11 @@
 """Unit tests for CLI formatting helpers."""
 
-from imdfetch.cli import _display_observation, get_weather
+import json
+
+import pytest
+
+from imdfetch.cli import _display_observation, batch_weather, get_weather
+from imdfetch.exceptions import CityNotFoundError
 from imdfetch.weather import WeatherData, WeatherParameter
 
 
@@ -19,6 +24,18 @@ class FakeClient:
             ],
         )
 
+    def get_many_current_weather(
+        self, city_identifiers, max_workers=8, return_exceptions=False
+    ):
+        return [
+            (
+                CityNotFoundError(f"No cities found matching '{c}'")
+                if c == "Atlantis"
+                else self.get_current_weather(c)
+            )
+            for c in city_identifiers
+        ]
+
 
 def test_display_observation_replaces_imd_sentinel_values():
     assert _display_observation("Minimum Temperature", "99.9") == ("NA", True)
@@ -37,3 +54,19 @@ def test_get_weather_warns_when_observations_are_unavailable(capsys):
     assert "24h Rainfall (mm): NA" in out
     assert "Relative Humidity at 08:30: NA" in out
     assert "Observation values appear unavailable for this station." in out
+
+
+def test_batch_weather_emits_one_json_line_per_city(capsys):
+    with pytest.raises(SystemExit) as exc:
+        batch_weather(FakeClient(), ["99943\n", "\n", "Atlantis\n"])
+
+    lines = capsys.readouterr().out.splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert exc.value.code == 1  # one city failed
+    assert records[0]["query"] == 99943
+    assert records[0]["city"] == "Mumbai-Chembur"
+    assert records[1] == {
+        "query": "Atlantis",
+        "error": "No cities found matching 'Atlantis'",
+    }
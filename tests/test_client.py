@@ -0,0 +1,199 @@
+"""Unit tests for IMDWeatherClient's city index, caches and batch API (no network)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from imdfetch.client import IMDWeatherClient
+from imdfetch.exceptions import CityNotFoundError, NetworkError
+from imdfetch.weather import CityInfo
+
+
+def _client_with_fake_weather(monkeypatch):
+    """A client whose get_current_weather fails for city_id 0 and otherwise
+    returns a New Delhi reading tagged with the requested city_id."""
+    client = IMDWeatherClient()
+    monkeypatch.setattr(client, "get_cities", lambda refresh_cache=False: [])
+
+    def fake_weather(city_id):
+        if city_id == 0:
+            raise NetworkError("down")
+        return IMDWeatherClient._weather_from_json(
+            {"station": "New Delhi", "dat": "2024-06-01", "max": "35"},
+            city_id=city_id,
+        )
+
+    monkeypatch.setattr(client, "get_current_weather", fake_weather)
+    return client
+
+
+class TestGetManyCurrentWeather:
+    def test_preserves_input_order(self, monkeypatch):
+        client = _client_with_fake_weather(monkeypatch)
+        results = client.get_many_current_weather([3, 1, 2], max_workers=3)
+        assert [w.city_id for w in results] == [3, 1, 2]
+
+    def test_return_exceptions_keeps_failures_in_place(self, monkeypatch):
+        client = _client_with_fake_weather(monkeypatch)
+        results = client.get_many_current_weather([1, 0], return_exceptions=True)
+        assert results[0].city_id == 1
+        assert isinstance(results[1], NetworkError)
+
+    def test_raises_by_default(self, monkeypatch):
+        client = _client_with_fake_weather(monkeypatch)
+        with pytest.raises(NetworkError):
+            client.get_many_current_weather([1, 0])
+
+
+class TestResponseCache:
+    @patch("imdfetch.client.safe_get")
+    def test_html_page_fetched_once_within_ttl(self, mock_safe_get):
+        mock_safe_get.return_value = MagicMock(text="<html></html>")
+        client = IMDWeatherClient()
+
+        assert client._fetch_html(42182) == "<html></html>"
+        assert client._fetch_html(42182) == "<html></html>"
+        assert mock_safe_get.call_count == 1
+
+    @patch("imdfetch.client.safe_post")
+    def test_failed_fetch_is_not_cached(self, mock_safe_post):
+        ok = MagicMock()
+        ok.json.return_value = [{"station": "New Delhi"}]
+        mock_safe_post.side_effect = [NetworkError("down"), ok]
+        client = IMDWeatherClient()
+
+        with pytest.raises(NetworkError):
+            client._fetch_city_static(42182)
+        assert client._fetch_city_static(42182) == {"station": "New Delhi"}
+        assert client._fetch_city_static(42182) == {"station": "New Delhi"}
+        assert mock_safe_post.call_count == 2
+
+
+class TestGetWeatherBatch:
+    def test_one_row_per_city_with_param_columns_and_errors(self, monkeypatch):
+        client = _client_with_fake_weather(monkeypatch)
+
+        df = client.get_weather_batch([42182, 0])
+
+        assert list(df["query"]) == [42182, 0]
+        assert list(df["status"]) == ["success", "error"]
+        assert df.loc[0, "max_temp"] == "35"
+        assert df.loc[0, "city"] == "New Delhi"
+        assert df.loc[1, "error"] == "down"
+
+
+class TestFindCity:
+    def _client(self):
+        client = IMDWeatherClient()
+        client._set_cities(
+            [
+                CityInfo(1, "New Delhi (Safdarjung)", "1", clean_name="New Delhi"),
+                CityInfo(2, "NEW DELHI-Palam", "2", clean_name="New Delhi-Palam"),
+                CityInfo(3, "Mumbai", "3", clean_name="Mumbai"),
+            ]
+        )
+        return client
+
+    def test_substring_match_is_case_insensitive(self):
+        matches = self._client().find_city("delhi")
+        assert [c.city_id for c in matches] == [1, 2]
+
+    def test_exact_match_on_clean_name(self):
+        matches = self._client().find_city(" NEW DELHI ", exact_match=True)
+        assert [c.city_id for c in matches] == [1]
+
+    def test_city_matching_on_both_names_is_returned_once(self):
+        matches = self._client().find_city("mumbai")
+        assert [c.city_id for c in matches] == [3]
+
+    def test_empty_search_returns_all_cities(self):
+        assert len(self._client().find_city("")) == 3
+
+    def test_snapshot_is_unaffected_by_refresh(self):
+        client = self._client()
+        snapshot = client._ensure_city_index()
+        client._set_cities([CityInfo(9, "Chennai", "9", clean_name="Chennai")] * 5)
+        matches = client._find_city_in(snapshot, "delhi", exact_match=False)
+        assert [c.city_id for c in matches] == [1, 2]
+
+    def test_get_city_by_id(self):
+        client = self._client()
+        assert client.get_city_by_id(2).display_name == "NEW DELHI-Palam"
+        assert client.get_city_by_id(99) is None
+
+    def test_resolve_prefers_single_exact_match(self):
+        assert self._client()._resolve_city_id("New Delhi") == 1
+
+    def test_resolve_ambiguous_raises(self):
+        with pytest.raises(CityNotFoundError, match="Multiple cities"):
+            self._client()._resolve_city_id("Delhi")
+
+    def test_resolve_is_cached_until_city_list_refresh(self, monkeypatch):
+        client = self._client()
+        assert client._resolve_city_id("Mumbai") == 3
+
+        monkeypatch.setattr(client, "_find_city_in", lambda *a, **kw: [])
+        assert client._resolve_city_id("Mumbai") == 3
+
+        client._set_cities([CityInfo(3, "Mumbai", "3", clean_name="Mumbai")])
+        with pytest.raises(CityNotFoundError):
+            client._resolve_city_id("Mumbai")
+
+
+class TestGetCitiesDataframe:
+    def test_columns_and_dtypes(self):
+        client = IMDWeatherClient()
+        client._set_cities(
+            [
+                CityInfo(42182, "New Delhi", "42182", clean_name="New Delhi"),
+                CityInfo(43003, "Mumbai", "43003"),
+            ]
+        )
+        df = client.get_cities_dataframe()
+        assert list(df.columns) == [
+            "city_id",
+            "display_name",
+            "clean_name",
+            "full_value",
+        ]
+        assert df["city_id"].dtype == "int32"
+        assert df["display_name"].dtype == "string"
+        assert list(df["city_id"]) == [42182, 43003]
+        assert df["clean_name"].isna().tolist() == [False, True]
+
+    def test_frame_is_reused_per_city_list_and_returned_as_copy(self):
+        client = IMDWeatherClient()
+        client._set_cities([CityInfo(1, "A", "1")])
+        first = client.get_cities_dataframe()
+        first.loc[0, "display_name"] = "mutated"
+        assert client.get_cities_dataframe().loc[0, "display_name"] == "A"
+
+        client._set_cities([CityInfo(2, "B", "2")])
+        assert list(client.get_cities_dataframe()["city_id"]) == [2]
+
+
+class TestCitiesCache:
+    @patch("imdfetch.client.safe_get")
+    def test_concurrent_cold_start_fetches_city_list_once(self, mock_safe_get):
+        def slow_get(url, session=None):
+            time.sleep(0.05)
+            return MagicMock(text="<option value='42182'>New Delhi</option>")
+
+        mock_safe_get.side_effect = slow_get
+        client = IMDWeatherClient()
+        threads = [threading.Thread(target=client.get_cities) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_safe_get.call_count == 1
+        assert [c.city_id for c in client.get_cities()] == [42182]
+
+    def test_get_cities_returns_a_fresh_list(self):
+        client = IMDWeatherClient()
+        client._set_cities([CityInfo(1, "A", "1")])
+        client.get_cities().clear()
+        assert len(client.get_cities()) == 1
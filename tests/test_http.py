@@ -1,9 +1,11 @@
-"""Unit tests for the retrying HTTP layer (requests is mocked — no network)."""
+"""Unit tests for the retrying HTTP layer (the session is mocked — no network)."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+import urllib3
 
 from imdfetch import http
 from imdfetch.exceptions import NetworkError
@@ -16,7 +18,7 @@ def _ok_response():
 
 
 class TestSafeGet:
-    @patch("imdfetch.http.requests.request")
+    @patch.object(http._SESSION, "request")
     def test_success_first_try_verifies_tls(self, mock_request):
         resp = _ok_response()
         mock_request.return_value = resp
@@ -26,7 +28,7 @@ class TestSafeGet:
         _, kwargs = mock_request.call_args
         assert kwargs["verify"] is True
 
-    @patch("imdfetch.http.requests.request")
+    @patch.object(http._SESSION, "request")
     def test_ssl_error_falls_back_to_no_verify(self, mock_request):
         resp = _ok_response()
         mock_request.side_effect = [requests.exceptions.SSLError("bad cert"), resp]
@@ -36,16 +38,27 @@ class TestSafeGet:
         assert mock_request.call_args_list[0].kwargs["verify"] is True
         assert mock_request.call_args_list[1].kwargs["verify"] is False
 
-    @patch("imdfetch.http.requests.request")
+    @patch.object(http._SESSION, "request")
     def test_raises_network_error_after_exhaustion(self, mock_request):
         mock_request.side_effect = requests.exceptions.ConnectionError("down")
 
         with pytest.raises(NetworkError):
-            http.safe_get("https://example.test", max_retries=0)
+            http.safe_get("https://example.test")
+        # Retries happen inside the adapter, not as repeated session calls.
+        assert mock_request.call_count == 1
+
+    @patch.object(http._SESSION, "request")
+    def test_http_error_status_raises_network_error(self, mock_request):
+        resp = _ok_response()
+        resp.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+        mock_request.return_value = resp
+
+        with pytest.raises(NetworkError):
+            http.safe_get("https://example.test")
 
 
 class TestSafePost:
-    @patch("imdfetch.http.requests.request")
+    @patch.object(http._SESSION, "request")
     def test_sends_post_with_data_and_merged_headers(self, mock_request):
         resp = _ok_response()
         mock_request.return_value = resp
@@ -62,3 +75,94 @@ class TestSafePost:
         assert kwargs["headers"]["Referer"] == "https://ref.test"
         # Default headers are still merged in.
         assert "User-Agent" in kwargs["headers"]
+        assert "gzip" in kwargs["headers"]["Accept-Encoding"]
+
+
+class TestFetchMany:
+    @patch.object(http._SESSION, "request")
+    def test_returns_responses_keyed_by_url(self, mock_request):
+        responses = {"https://a.test": _ok_response(), "https://b.test": _ok_response()}
+        mock_request.side_effect = lambda method, url, **kw: responses[url]
+        urls = ["https://a.test", "https://b.test", "https://a.test"]
+
+        out = http.fetch_many(urls, max_workers=2)
+        assert list(out) == ["https://a.test", "https://b.test"]
+        assert out["https://b.test"] is responses["https://b.test"]
+        assert mock_request.call_count == 2
+
+    @patch.object(http._SESSION, "request")
+    def test_failure_raises_network_error(self, mock_request):
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+
+        with pytest.raises(NetworkError):
+            http.fetch_many(["https://a.test"])
+
+
+class TestSafeGetMany:
+    @patch.object(http._SESSION, "request")
+    def test_returns_responses_in_order(self, mock_request):
+        responses = {"https://a.test": _ok_response(), "https://b.test": _ok_response()}
+        mock_request.side_effect = lambda method, url, **kw: responses[url]
+
+        out = asyncio.run(http.safe_get_many(["https://b.test", "https://a.test"]))
+        assert out == [responses["https://b.test"], responses["https://a.test"]]
+
+    @patch.object(http._SESSION, "request")
+    def test_failure_raises_network_error(self, mock_request):
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+
+        with pytest.raises(NetworkError):
+            asyncio.run(http.safe_get_many(["https://a.test"]))
+
+
+class TestSession:
+    def test_explicit_session_is_used_instead_of_shared_pool(self):
+        session = MagicMock(spec=requests.Session)
+        resp = _ok_response()
+        session.request.return_value = resp
+
+        with patch.object(http._SESSION, "request") as shared:
+            assert http.safe_get("https://example.test", session=session) is resp
+            shared.assert_not_called()
+        assert session.request.call_count == 1
+
+    def test_max_retries_selects_matching_shared_session(self):
+        session = http._shared_session(0)
+        assert session is not http._SESSION
+        assert http._shared_session(0) is session
+        assert http._shared_session(http.DEFAULT_MAX_RETRIES) is http._SESSION
+
+        with patch.object(session, "request") as mock_request:
+            mock_request.return_value = _ok_response()
+            http.safe_get("https://example.test", max_retries=0)
+        assert mock_request.call_count == 1
+
+    def test_new_session_retries_in_adapter(self):
+        retry = http.new_session(max_retries=5).get_adapter("https://x").max_retries
+        assert retry.total == 5
+        assert (retry.connect, retry.read) == (5, 5)
+        assert retry.respect_retry_after_header
+        assert 503 in retry.status_forcelist
+        assert "POST" in retry.allowed_methods
+
+    def test_backoff_is_jittered(self, monkeypatch):
+        from urllib3.util.retry import RequestHistory
+
+        monkeypatch.setattr(http.random, "uniform", lambda lo, hi: hi)
+        history = (RequestHistory("GET", "/", None, 503, None),) * 3
+        retry = http._JitteredRetry(total=5, backoff_factor=1.0, history=history)
+        assert retry.get_backoff_time() == 4.0 + 1.0
+        # The first retry (one error so far) is still immediate.
+        assert retry.new(history=history[:1]).get_backoff_time() == 0
+
+    def test_ssl_error_is_not_retried(self):
+        # Retrying a bad certificate only delays _request's verify=False fallback
+        retry = http.new_session(max_retries=5).get_adapter("https://x").max_retries
+        error = urllib3.exceptions.SSLError("certificate verify failed")
+        with pytest.raises(urllib3.exceptions.SSLError):
+            retry.increment("GET", "/", error=error)
+
+    @pytest.mark.parametrize("scheme", ["https", "http"])
+    def test_new_session_mounts_pooled_adapter(self, scheme):
+        adapter = http.new_session().get_adapter(f"{scheme}://example.test")
+        assert adapter._pool_maxsize == http.HTTP_POOL_MAXSIZE
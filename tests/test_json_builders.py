@@ -191,7 +191,7 @@ class TestNearestStation:
             "https://ok.test",
         ]
         assert all(
-            call.kwargs == {"max_retries": 0, "timeout": 5}
+            call.kwargs == {"max_retries": 0, "timeout": 5, "session": None}
             for call in mock_safe_get.call_args_list
         )
 
@@ -213,6 +213,6 @@ class TestNearestStation:
 
         assert len(mock_safe_get.call_args_list) == 2
         assert all(
-            call.kwargs == {"max_retries": 0, "timeout": 5}
+            call.kwargs == {"max_retries": 0, "timeout": 5, "session": None}
             for call in mock_safe_get.call_args_list
         )
@@ -1,6 +1,12 @@
 """Unit tests for the weather dataclasses (no network)."""
 
+import sys
+from dataclasses import asdict
+
+import pytest
+
 from imdfetch.weather import (
+    CityInfo,
     ForecastData,
     ForecastDay,
     WeatherData,
@@ -27,11 +33,40 @@ class TestWeatherData:
     def test_get_parameter_missing_returns_none(self):
         assert _sample_weather().get_parameter("Rainfall") is None
 
+    def test_get_parameter_memo_reset_when_parameters_reassigned(self):
+        wd = _sample_weather()
+        assert wd.get_parameter("maximum temperature") == "35"
+        assert wd.get_parameter("Rainfall") is None
+        wd.parameters = [WeatherParameter(parameter="24 Hours Rainfall", value="2")]
+        assert wd.get_parameter("Rainfall") == "2"
+        assert wd.get_parameter("maximum temperature") is None
+
+    def test_get_parameter_memo_is_not_a_field(self):
+        wd = _sample_weather()
+        wd.get_parameter("Maximum Temperature")
+        assert asdict(wd) == asdict(_sample_weather())
+        assert wd == _sample_weather()
+
+    def test_get_parameters_batch_lookup(self):
+        values = _sample_weather().get_parameters(
+            ["Minimum Temperature", "Maximum Temperature", "Rainfall"]
+        )
+        assert values == {
+            "Minimum Temperature": "25",
+            "Maximum Temperature": "35",
+            "Rainfall": None,
+        }
+
     def test_to_dict_flattens_parameters(self):
         d = _sample_weather().to_dict()
         assert d["city"] == "New Delhi"
         assert d["parameters"]["Maximum Temperature (°C)"] == "35"
 
+    def test_to_dict_returns_fresh_nested_dict(self):
+        wd = _sample_weather()
+        wd.to_dict()["parameters"]["Maximum Temperature (°C)"] = "CORRUPT"
+        assert wd.to_dict()["parameters"]["Maximum Temperature (°C)"] == "35"
+
 
 class TestForecastData:
     def _sample(self):
@@ -59,6 +94,40 @@ class TestForecastData:
     def test_get_day_forecast_missing_returns_none(self):
         assert self._sample().get_day_forecast("2099-01-01") is None
 
+    def test_get_day_forecast_index_reset_when_days_reassigned(self):
+        fd = self._sample()
+        assert fd.get_day_forecast("01-Jun") is not None
+        fd.days = []
+        assert fd.get_day_forecast("01-Jun") is None
+
+    def test_get_day_forecast_index_is_not_a_field(self):
+        fd = self._sample()
+        fd.get_day_forecast("01-Jun")
+        assert asdict(fd) == asdict(self._sample())
+
     def test_to_dict_includes_days(self):
         d = self._sample().to_dict()
         assert d["days"][0]["forecast"] == "Sunny"
+
+    def test_to_dict_reflects_days_reassigned(self):
+        fd = self._sample()
+        assert len(fd.to_dict()["days"]) == 1
+        fd.days = []
+        assert fd.to_dict()["days"] == []
+
+
+class TestSlots:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            CityInfo(42182, "New Delhi", "42182"),
+            WeatherParameter(parameter="Sunset", value="19:10"),
+            _sample_weather(),
+            ForecastDay(date="01-Jun", min_temp="25", max_temp="35", forecast="Sunny"),
+            ForecastData(city="New Delhi", forecast_date="2024-06-01"),
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    def test_models_use_slots(self, instance):
+        assert not hasattr(instance, "__dict__")
@@ -45,15 +45,53 @@ Local Weather Report and Forecast For:</b> <FONT color="blue">New Delhi</Font>
 
 class TestParseCityList:
     def test_extracts_ids_and_names(self):
-        df = WeatherDataParser.parse_city_list(CITY_LIST_HTML)
+        rows = WeatherDataParser.parse_city_list(CITY_LIST_HTML)
+        assert [r["city_id"] for r in rows] == [42182, 43003]
+        assert {r["display_name"] for r in rows} == {"New Delhi", "Mumbai"}
+
+    def test_accepts_double_quotes_and_entities(self):
+        html = (
+            '<select><option value="">Choose</option>'
+            '<option value="42182">Delhi &amp; NCR</option></select>'
+        )
+        rows = WeatherDataParser.parse_city_list(html)
+        assert rows == [
+            {"city_id": 42182, "display_name": "Delhi & NCR", "full_value": "42182"}
+        ]
+
+    def test_cityinfo_list(self):
+        cities = WeatherDataParser.parse_city_list_as_cityinfo(CITY_LIST_HTML)
+        assert [c.city_id for c in cities] == [42182, 43003]
+        assert cities[0].clean_name == "New Delhi"
+        assert WeatherDataParser.get_cities_dataframe(CITY_LIST_HTML) == cities
+
+    def test_dataframe_wrapper(self):
+        df = WeatherDataParser.parse_city_list_as_dataframe(CITY_LIST_HTML)
         assert list(df["city_id"]) == [42182, 43003]
-        assert set(df["display_name"]) == {"New Delhi", "Mumbai"}
+        assert list(df.columns) == ["city_id", "display_name", "full_value"]
 
     def test_empty_html_raises(self):
         with pytest.raises(DataParsingError):
             WeatherDataParser.parse_city_list("<html></html>")
 
 
+class TestParseCityAndDate:
+    def test_reads_city_and_date_after_heading(self):
+        info = WeatherDataParser.parse_city_and_date(PAST_24_HTML)
+        assert info["city"] == "New Delhi"
+        assert info["date"] == "2024-06-01"
+
+    def test_date_outside_heading_window_still_found(self):
+        html = (
+            "<B>Dated : 2024-06-01</b>"
+            + " " * 4096
+            + 'Local Weather Report and Forecast For:</b> <FONT color="blue">Pune</Font>'
+        )
+        info = WeatherDataParser.parse_city_and_date(html)
+        assert info["city"] == "Pune"
+        assert info["date"] == "2024-06-01"
+
+
 class TestParsePast24Hours:
     def test_extracts_city_date_and_parameters(self):
         wd = WeatherDataParser.parse_past_24_hours(PAST_24_HTML)
@@ -66,6 +104,26 @@ class TestParsePast24Hours:
         with pytest.raises(DataParsingError):
             WeatherDataParser.parse_past_24_hours("<html>no table</html>")
 
+    def test_page_without_marker_is_not_parsed(self, monkeypatch):
+        from imdfetch import parser
+
+        def fail(*args, **kwargs):
+            raise AssertionError("tree should not be built")
+
+        monkeypatch.setattr(parser.lxml_html, "fromstring", fail)
+        with pytest.raises(DataParsingError, match="table not found"):
+            WeatherDataParser.parse_past_24_hours("<html>Service Unavailable</html>")
+
+    def test_nested_table_and_inline_markup(self):
+        html = (
+            "<table><tr><td><table>"
+            "<tr><th>Past 24 Hours Weather Data</th><th>h</th></tr>"
+            "<tr><td>Sunset</td><td> 19:<b>10</b> </td></tr>"
+            "</table></td></tr></table>"
+        )
+        wd = WeatherDataParser.parse_past_24_hours(html)
+        assert wd.get_parameter("Sunset") == "19:10"
+
 
 class TestParseForecastTable:
     def test_extracts_forecast_day(self):
@@ -81,3 +139,27 @@ class TestParseForecastTable:
     def test_missing_table_raises(self):
         with pytest.raises(DataParsingError):
             WeatherDataParser.parse_forecast_table("<html>no table</html>")
+
+    def test_page_without_forecast_table_is_not_parsed(self, monkeypatch):
+        from imdfetch import parser
+
+        def fail(*args, **kwargs):
+            raise AssertionError("tree should not be built")
+
+        # The page heading says "Forecast", but there is no forecast table
+        monkeypatch.setattr(parser.lxml_html, "fromstring", fail)
+        with pytest.raises(DataParsingError, match="table not found"):
+            WeatherDataParser.parse_forecast_table(PAST_24_HTML)
+
+
+class TestParseWeatherPage:
+    def test_extracts_both_tables_from_one_page(self):
+        page = PAST_24_HTML.replace("</html>", "") + FORECAST_HTML
+        wd, fc = WeatherDataParser.parse_weather_page(page)
+        assert wd.get_parameter("Maximum Temperature") == "35.0"
+        assert fc.days[0].forecast == "Sunny"
+        assert wd.city == fc.city == "New Delhi"
+
+    def test_missing_forecast_table_raises(self):
+        with pytest.raises(DataParsingError, match="forecast"):
+            WeatherDataParser.parse_weather_page(PAST_24_HTML)
@@ -2,13 +2,16 @@
 
 from datetime import datetime
 
+import numpy as np
 import pytest
 
 from imdfetch.utils import (
     clean_city_name,
     clean_parameter_name,
     colorize_humidity,
+    colorize_humidity_array,
     colorize_temperature,
+    colorize_temperature_array,
     convert_date_to_iso,
     format_date,
     parse_date,
@@ -37,6 +40,8 @@ class TestCleanParameterName:
             ("Minimum Temperature", "Minimum Temperature (°C)"),
             ("24 Hours Rainfall (mm)", "24 Hours Rainfall (mm)"),
             ("Sunset", "Today's Sunset (IST)"),
+            ("Departure from Normal (Min)", "Min Temp Departure from Normal (°C)"),
+            ("Departure from Normal", "Temperature Departure from Normal (°C)"),
         ],
     )
     def test_canonicalizes_known_params(self, raw, expected):
@@ -55,10 +60,35 @@ class TestConvertDateToIso:
         year = datetime.now().year
         assert convert_date_to_iso("2-Jun") == f"{year}-06-02"
 
-    @pytest.mark.parametrize("bad", ["", "notadate", "27-Xyz", "27"])
+    def test_space_separated(self):
+        year = datetime.now().year
+        assert convert_date_to_iso("27 May") == f"{year}-05-27"
+
+    @pytest.mark.parametrize("text", ["14-Jan.", "14 Jan.", "14-January"])
+    def test_month_with_trailing_text(self, text):
+        assert convert_date_to_iso(text) == f"{datetime.now().year}-01-14"
+
+    @pytest.mark.parametrize(
+        "bad",
+        ["", "notadate", "27-Xyz", "27", "27-May-2025", "27 May 2025", "ab-May"],
+    )
     def test_unparseable_returns_none(self, bad):
         assert convert_date_to_iso(bad) is None
 
+    def test_cached_result_follows_year_change(self, monkeypatch):
+        from imdfetch import dates
+
+        class FakeDatetime:
+            year = 2030
+
+            @classmethod
+            def now(cls):
+                return cls
+
+        assert convert_date_to_iso("27-May").startswith(f"{datetime.now().year}-")
+        monkeypatch.setattr(dates, "datetime", FakeDatetime)
+        assert convert_date_to_iso("27-May") == "2030-05-27"
+
 
 class TestParseDate:
     def test_iso_passthrough(self):
@@ -67,10 +97,25 @@ class TestParseDate:
     def test_long_form(self):
         assert parse_date("May 27, 2025") == "2025-05-27"
 
+    @pytest.mark.parametrize(
+        "text",
+        ["27 May 2025", "27-05-2025", "27/05/2025", "27 May 25", "May  27 2025"],
+    )
+    def test_other_formats(self, text):
+        assert parse_date(text) == "2025-05-27"
+
     @pytest.mark.parametrize("bad", ["", "not a date"])
     def test_unparseable_returns_none(self, bad):
         assert parse_date(bad) is None
 
+    @pytest.mark.parametrize("bad", ["2025-02-30", "2025-13-01"])
+    def test_invalid_iso_returns_none(self, bad):
+        assert parse_date(bad) is None
+
+    def test_ambiguous_slash_date_does_not_depend_on_history(self):
+        assert parse_date("05/27/2025") == "2025-05-27"  # only %m/%d/%Y fits
+        assert parse_date("05/06/2025") == "2025-06-05"  # %d/%m/%Y wins
+
 
 class TestColorize:
     def test_temperature_passes_through_na(self):
@@ -88,9 +133,31 @@ class TestColorize:
         assert "82" in out and out.endswith("\033[0m")
 
 
+class TestColorizeArray:
+    def test_matches_scalar_temperature(self):
+        values = [-5.0, 10.0, 24.9, 35.0, 40.5, float("nan"), float("inf")]
+        assert colorize_temperature_array(np.array(values)) == [
+            colorize_temperature(v) for v in values
+        ]
+
+    def test_matches_scalar_humidity_for_ints(self):
+        values = [10, 30, 65, 95]
+        assert colorize_humidity_array(values) == [colorize_humidity(v) for v in values]
+
+    def test_string_values_keep_na_passthrough(self):
+        assert colorize_temperature_array(["NA", "30"]) == [
+            "NA",
+            colorize_temperature("30"),
+        ]
+
+
 class TestFormatDate:
     def test_iso_to_readable(self):
         assert format_date("2027-05-25", include_day=False) == "25 May, 2027"
 
     def test_unparseable_returns_input(self):
         assert format_date("garbage") == "garbage"
+
+    def test_include_day_is_part_of_cache_key(self):
+        assert format_date("2027-05-25") == "25 May, 2027 (Tuesday)"
+        assert format_date("2027-05-25", include_day=False) == "25 May, 2027"